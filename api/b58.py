@@ -0,0 +1,92 @@
+import re
+
+try:
+    import based58
+except ImportError:
+    based58 = None
+
+ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
+# Work in chunks of 10 digits so the big-int divmods run 10x less often,
+# and render each chunk as five 2-digit table lookups
+_CHUNK_DIGITS = 10
+_CHUNK = 58 ** _CHUNK_DIGITS
+_PAIRS = [a + b for a in ALPHABET for b in ALPHABET]
+_VALUES = {char: value for value, char in enumerate(ALPHABET)}
+_POWERS = [58 ** n for n in range(_CHUNK_DIGITS + 1)]
+# 64 bytes encode to at most 88 base58 characters
+_SIGNATURE_TEXT = re.compile(f"[{ALPHABET}]{{1,88}}")
+
+
+def _encode_py(data):
+    zeros = len(data) - len(data.lstrip(b"\0"))
+    n = int.from_bytes(data, "big")
+
+    chunks = []
+    while n:
+        n, chunk = divmod(n, _CHUNK)
+        chunks.append(chunk)
+
+    digits = []
+    for chunk in reversed(chunks):
+        pairs = []
+        for _ in range(_CHUNK_DIGITS // 2):
+            chunk, pair = divmod(chunk, 58 * 58)
+            pairs.append(_PAIRS[pair])
+        digits.append("".join(reversed(pairs)))
+
+    return "1" * zeros + "".join(digits).lstrip("1")
+
+
+def _decode_py(text):
+    zeros = len(text) - len(text.lstrip("1"))
+    n = 0
+    try:
+        for start in range(0, len(text), _CHUNK_DIGITS):
+            piece = text[start:start + _CHUNK_DIGITS]
+            chunk = 0
+            for char in piece:
+                chunk = chunk * 58 + _VALUES[char]
+            n = n * _POWERS[len(piece)] + chunk
+    except KeyError as e:
+        raise ValueError(f"Invalid base58 character {e.args[0]!r}") from None
+
+    body = n.to_bytes((n.bit_length() + 7) // 8, "big")
+    return b"\0" * zeros + body
+
+
+def encode(data):
+    """Encode bytes as a base58 string."""
+    if based58 is not None:
+        return based58.b58encode(data).decode("ascii")
+    return _encode_py(data)
+
+
+def decode(text):
+    """Decode a base58 string to bytes; raises ValueError on invalid input."""
+    if based58 is not None:
+        return bytes(based58.b58decode(text.encode("ascii")))
+    return _decode_py(text)
+
+
+def encode_batch(items):
+    """Encode a sequence of byte strings."""
+    return [encode(item) for item in items]
+
+
+def decode_batch(texts):
+    """Decode a sequence of base58 strings."""
+    return [decode(text) for text in texts]
+
+
+def decode_signature(text):
+    """Decode a base58 transaction signature to its raw 64 bytes."""
+    raw = decode(text)
+    if len(raw) != 64:
+        raise ValueError(f"Signature decodes to {len(raw)} bytes, expected 64")
+    return raw
+
+
+def is_signature_text(text):
+    """Cheap shape check for a base58 signature (alphabet and length) without decoding it."""
+    return isinstance(text, str) and _SIGNATURE_TEXT.fullmatch(text) is not None
@@ -0,0 +1,177 @@
+import argparse
+import asyncio
+import threading
+import time
+
+
+class ReorderBuffer:
+    """Holds out-of-order slot results and releases them strictly in slot order."""
+
+    def __init__(self, next_slot, emit):
+        self.next_slot = next_slot
+        self.emit = emit
+        self.pending = {}
+
+    def put(self, slot, lines):
+        """Store one slot's result and emit every slot that is now contiguous.
+
+        A slot counts as released even if emit raises, so later slots are never stuck behind it.
+        """
+        self.pending[slot] = lines
+        while self.next_slot in self.pending:
+            lines = self.pending.pop(self.next_slot)
+            try:
+                if lines:
+                    self.emit(self.next_slot, lines)
+            finally:
+                self.next_slot += 1
+
+
+class BackfillEngine:
+    """Fetches a slot range with a pool of workers and emits the output in slot order.
+
+    `fetch(slot)` returns the lines for a block ([] for an empty block), None
+    for a skipped slot, and raises on errors worth retrying. In asyncio mode
+    it may also be a coroutine function; plain functions run in threads.
+    `emit(slot, lines)` is called for every non-empty slot, in order; slots
+    whose emit raised are reported instead of stopping the backfill.
+    """
+
+    def __init__(self, fetch, emit, workers=8, retries=2, max_ahead=None):
+        self.fetch = fetch
+        self.emit = emit
+        self.workers = workers
+        self.retries = retries
+        # Bounds the reorder buffer: no worker runs further than this past the oldest gap
+        self.max_ahead = max_ahead or workers * 4
+
+    def run(self, start_slot, end_slot):
+        """Backfill [start_slot, end_slot] using worker threads and return a report."""
+        report = self._new_report(start_slot, end_slot)
+        buffer = ReorderBuffer(start_slot, self._emit_counted(report))
+        slots = iter(range(start_slot, end_slot + 1))
+        lock = threading.Lock()
+        window = threading.Condition(lock)
+
+        def worker():
+            while True:
+                with lock:
+                    slot = next(slots, None)
+                    if slot is None:
+                        return
+                    window.wait_for(lambda: slot < buffer.next_slot + self.max_ahead)
+
+                lines = self._fetch_with_retries(slot, report)
+
+                with lock:
+                    buffer.put(slot, lines)
+                    window.notify_all()
+
+        threads = [threading.Thread(target=worker, daemon=True) for _ in range(self.workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        return self._finish_report(report)
+
+    async def run_async(self, start_slot, end_slot):
+        """Backfill [start_slot, end_slot] using asyncio tasks and return a report."""
+        report = self._new_report(start_slot, end_slot)
+        buffer = ReorderBuffer(start_slot, self._emit_counted(report))
+        slots = iter(range(start_slot, end_slot + 1))
+        window = asyncio.Condition()
+
+        async def worker():
+            for slot in slots:
+                async with window:
+                    await window.wait_for(lambda: slot < buffer.next_slot + self.max_ahead)
+
+                lines = await self._fetch_with_retries_async(slot, report)
+
+                async with window:
+                    buffer.put(slot, lines)
+                    window.notify_all()
+
+        await asyncio.gather(*(worker() for _ in range(self.workers)))
+        return self._finish_report(report)
+
+    def _fetch_with_retries(self, slot, report):
+        for _ in range(self.retries + 1):
+            try:
+                return self._record(slot, self.fetch(slot), report)
+            except Exception as e:
+                error = e
+        return self._record_failure(slot, error, report)
+
+    async def _fetch_with_retries_async(self, slot, report):
+        for _ in range(self.retries + 1):
+            try:
+                if asyncio.iscoroutinefunction(self.fetch):
+                    lines = await self.fetch(slot)
+                else:
+                    lines = await asyncio.to_thread(self.fetch, slot)
+                return self._record(slot, lines, report)
+            except Exception as e:
+                error = e
+        return self._record_failure(slot, error, report)
+
+    def _record(self, slot, lines, report):
+        if lines is None:
+            report["skipped_slots"].append(slot)
+        elif not lines:
+            report["empty_slots"].append(slot)
+        return lines
+
+    def _record_failure(self, slot, error, report):
+        print(f"Backfill of Slot {slot} failed: {error}")
+        report["failed_slots"].append(slot)
+        return None
+
+    def _emit_counted(self, report):
+        def emit(slot, lines):
+            try:
+                self.emit(slot, lines)
+            except Exception as e:
+                print(f"Emitting Slot {slot} failed: {e}")
+                report["emit_failed_slots"].append(slot)
+                return
+            report["emitted_lines"] += len(lines)
+        return emit
+
+    def _new_report(self, start_slot, end_slot):
+        return {
+            "start_slot": start_slot,
+            "end_slot": end_slot,
+            "emitted_lines": 0,
+            "skipped_slots": [],
+            "empty_slots": [],
+            "failed_slots": [],
+            "emit_failed_slots": [],
+            "started": time.perf_counter()
+        }
+
+    def _finish_report(self, report):
+        report["elapsed_s"] = round(time.perf_counter() - report.pop("started"), 3)
+        for key in ("skipped_slots", "empty_slots", "failed_slots", "emit_failed_slots"):
+            report[key].sort()
+        return report
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Backfill narrative lines for a slot range.")
+    parser.add_argument("start_slot", type=int)
+    parser.add_argument("end_slot", type=int)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--asyncio", action="store_true", help="use asyncio tasks instead of threads")
+    args = parser.parse_args()
+
+    from index import fetch_slot_strings
+
+    engine = BackfillEngine(fetch_slot_strings, lambda slot, lines: print("\n".join(lines)),
+                            workers=args.workers)
+    if args.asyncio:
+        report = asyncio.run(engine.run_async(args.start_slot, args.end_slot))
+    else:
+        report = engine.run(args.start_slot, args.end_slot)
+    print(report)
@@ -0,0 +1,165 @@
+import os
+import threading
+from collections import OrderedDict
+
+import codec
+
+# Only blocks at these commitment levels can never change and are safe to cache
+CACHEABLE_COMMITMENTS = ("finalized",)
+
+
+class BlockCache:
+    """LRU cache of blocks keyed by slot, commitment and detail level.
+
+    Entries are kept as encoded JSON so the memory bound is measured in real
+    bytes. With `disk_dir` set, every block is also written to disk and read
+    back on a memory miss, so warm restarts don't go to the network; the
+    oldest files are deleted once the directory grows past `disk_max_bytes`.
+    Blocks at a commitment level that can still change are not cached.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, disk_dir=None, disk_max_bytes=1024 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self.disk_max_bytes = disk_max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        # path -> size of the files in disk_dir, oldest first
+        self._disk_files = OrderedDict()
+        self._disk_lock = threading.Lock()
+
+        self.size_bytes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.disk_bytes = 0
+        self.disk_evictions = 0
+
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+            self._scan_disk()
+
+    def get(self, slot, commitment, transaction_details):
+        """Return the cached block, or None on a miss."""
+        key = (slot, commitment, transaction_details)
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return codec.loads(data)
+
+        data = self._read_disk(key)
+        if data is None:
+            self.misses += 1
+            return None
+
+        self.disk_hits += 1
+        self._store(key, data)
+        return codec.loads(data)
+
+    def put(self, slot, commitment, transaction_details, block_data):
+        """Cache a block in memory and, if enabled, on disk."""
+        if commitment not in CACHEABLE_COMMITMENTS:
+            return
+        key = (slot, commitment, transaction_details)
+        data = codec.dumps(block_data)
+        self._store(key, data)
+        self._write_disk(key, data)
+
+    def stats(self):
+        """Report size, hit/miss counts and evictions."""
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "size_bytes": self.size_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.hits + self.disk_hits) / lookups, 4) if lookups else None,
+            "evictions": self.evictions,
+            "disk_dir": self.disk_dir,
+            "disk_files": len(self._disk_files),
+            "disk_bytes": self.disk_bytes,
+            "disk_max_bytes": self.disk_max_bytes,
+            "disk_evictions": self.disk_evictions
+        }
+
+    def _store(self, key, data):
+        # A single block bigger than the whole budget is never kept in memory
+        if len(data) > self.max_bytes:
+            return
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.size_bytes -= len(old)
+            self._entries[key] = data
+            self.size_bytes += len(data)
+
+            # Evict least recently used blocks until we are back under budget
+            while self.size_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size_bytes -= len(evicted)
+                self.evictions += 1
+
+    def _path(self, key):
+        slot, commitment, transaction_details = key
+        return os.path.join(self.disk_dir, f"{slot}-{commitment}-{transaction_details}.json")
+
+    def _read_disk(self, key):
+        if not self.disk_dir:
+            return None
+        try:
+            with open(self._path(key), "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _write_disk(self, key, data):
+        if not self.disk_dir:
+            return
+        path = self._path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            # Write then rename so a crash never leaves a half-written block behind
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Failed to write block cache file {path}: {e}")
+            return
+
+        with self._disk_lock:
+            old = self._disk_files.pop(path, None)
+            if old is not None:
+                self.disk_bytes -= old
+            self._disk_files[path] = len(data)
+            self.disk_bytes += len(data)
+            self._trim_disk()
+
+    def _scan_disk(self):
+        # Pick up files left by a previous run, oldest first, and trim them to the budget
+        files = []
+        for entry in os.scandir(self.disk_dir):
+            if entry.is_file() and entry.name.endswith(".json"):
+                stat = entry.stat()
+                files.append((stat.st_mtime, entry.path, stat.st_size))
+        with self._disk_lock:
+            for _, path, size in sorted(files):
+                self._disk_files[path] = size
+                self.disk_bytes += size
+            self._trim_disk()
+
+    def _trim_disk(self):
+        # Delete the oldest files until the directory is back under budget (caller holds _disk_lock)
+        while self.disk_bytes > self.disk_max_bytes and self._disk_files:
+            path, size = self._disk_files.popitem(last=False)
+            self.disk_bytes -= size
+            self.disk_evictions += 1
+            try:
+                os.remove(path)
+            except OSError as e:
+                print(f"Failed to remove block cache file {path}: {e}")
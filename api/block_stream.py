@@ -0,0 +1,92 @@
+import codecs
+import json
+import re
+
+_decoder = json.JSONDecoder()
+_whitespace = re.compile(r"[\s,]*")
+# Characters that can continue a JSON number, e.g. "15000000000." before "0"
+_number_tail = re.compile(r"[0-9.eE+\-]*")
+
+
+def iter_json_array(chunks, key):
+    """Incrementally parse a JSON document and yield the items of the array under `key`.
+
+    `chunks` is any iterable of bytes (e.g. response.iter_content()). Only the
+    item currently being decoded is held in memory, so peak memory stays
+    bounded by the largest single item rather than the whole document.
+    Raises ValueError if the document is an RPC error or has no such array.
+    """
+    start_pattern = re.compile(r'"%s"\s*:\s*\[' % re.escape(key))
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    chunks = iter(chunks)
+    buffer = ""
+    eof = False
+
+    def read_more():
+        nonlocal buffer, eof
+        chunk = next(chunks, None)
+        if chunk is None:
+            eof = True
+            buffer += utf8.decode(b"", final=True)
+        else:
+            buffer += utf8.decode(chunk)
+
+    # Phase 1: scan forward to the opening bracket of the array
+    while True:
+        match = start_pattern.search(buffer)
+        if match:
+            buffer = buffer[match.end():]
+            break
+        if eof:
+            _raise_for_document(buffer, key)
+        read_more()
+
+    # Phase 2: decode one item at a time; consumed text is dropped whenever we read more
+    pos = 0
+    while True:
+        pos = _whitespace.match(buffer, pos).end()
+        if pos == len(buffer):
+            if eof:
+                raise ValueError(f"Truncated JSON while reading '{key}'")
+            buffer = buffer[pos:]
+            pos = 0
+            read_more()
+            continue
+
+        if buffer[pos] == "]":
+            return
+
+        try:
+            item, end = _decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            # Most likely the item is split across chunks; a real syntax
+            # error still surfaces once there is nothing left to read
+            if eof:
+                raise
+            buffer = buffer[pos:]
+            pos = 0
+            read_more()
+            continue
+
+        # A number that runs to the end of the buffer may be cut short, even when the
+        # decoder stopped before a trailing "." or "e" it could not parse yet
+        if (not eof and type(item) in (int, float)
+                and _number_tail.match(buffer, end).end() == len(buffer)):
+            buffer = buffer[pos:]
+            pos = 0
+            read_more()
+            continue
+
+        yield item
+        pos = end
+
+
+def _raise_for_document(document, key):
+    try:
+        parsed = json.loads(document)
+    except json.JSONDecodeError:
+        raise ValueError(f"No '{key}' array in response")
+
+    if isinstance(parsed, dict) and "error" in parsed:
+        raise ValueError(f"Error retrieving block data: {parsed['error']}")
+    raise ValueError(f"No '{key}' array in response")
@@ -0,0 +1,144 @@
+import threading
+from collections import deque
+
+# What happens when a subscriber's queue is full: evict its oldest queued item,
+# discard the new one, or drop the subscriber so it reconnects and resumes
+POLICIES = ("drop-oldest", "drop-newest", "disconnect")
+
+
+class Subscription:
+    """One subscriber's bounded queue of (event id, encoded frame) items.
+
+    The queue always has room for one whole publish, however large, so the
+    slow-consumer policy only applies to a backlog the client has not drained.
+    """
+
+    def __init__(self, hub, maxsize, policy):
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown slow-consumer policy {policy!r}, expected one of {POLICIES}")
+        self.hub = hub
+        self.maxsize = maxsize
+        self.policy = policy
+        self.closed = False
+        self.dropped = 0
+        # A drop-oldest queue evicts by itself through maxlen
+        self._queue = deque(maxlen=maxsize if policy == "drop-oldest" else None)
+
+    def __len__(self):
+        return len(self._queue)
+
+    def get(self, timeout=None):
+        """Wait for queued items and return all of them; [] on timeout or once closed."""
+        with self.hub._changed:
+            self.hub._changed.wait_for(lambda: self._queue or self.closed, timeout)
+            items = list(self._queue)
+            self._queue.clear()
+        return items
+
+    def close(self):
+        self.hub.unsubscribe(self)
+
+    def _offer(self, items):
+        # Hub lock held; returns False when the subscriber must be disconnected
+        queue = self._queue
+        # A block bigger than maxsize only overflows by whatever backlog is still queued,
+        # so overflow never exceeds len(queue) and an idle client always takes the whole block
+        capacity = max(self.maxsize, len(items))
+        overflow = len(queue) + len(items) - capacity
+        if self.policy == "drop-oldest":
+            # Only resized around blocks bigger than maxsize; otherwise maxlen does the evicting
+            if queue.maxlen != capacity:
+                queue = self._queue = deque(queue, maxlen=capacity)
+            queue.extend(items)
+            self.dropped += max(overflow, 0)
+        elif overflow <= 0:
+            queue.extend(items)
+        elif self.policy == "drop-newest":
+            if overflow < len(items):
+                queue.extend(items[:len(items) - overflow])
+            self.dropped += min(overflow, len(items))
+        else:
+            return False
+        return True
+
+
+class Broadcaster:
+    """Fans one producer's events out to many subscribers.
+
+    Each event is encoded once by `encode(event_id, line)` and the same
+    bytes object is queued for every subscriber, so a client costs a queue
+    slot per event rather than a copy of the line.
+    """
+
+    def __init__(self, encode, maxsize=256, policy="drop-oldest"):
+        self.encode = encode
+        self.maxsize = maxsize
+        self.policy = policy
+        self._subscribers = set()
+        self._changed = threading.Condition()
+        self._relay = None
+        # Serialises start_relay so concurrent first requests cannot start two relays
+        self._relay_lock = threading.Lock()
+
+        self.published = 0
+        self.disconnected = 0
+
+    def __len__(self):
+        return len(self._subscribers)
+
+    def subscribe(self, maxsize=None, policy=None):
+        """Register a subscriber; defaults to the hub's queue size and policy."""
+        subscription = Subscription(self, maxsize or self.maxsize, policy or self.policy)
+        with self._changed:
+            self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._changed:
+            self._subscribers.discard(subscription)
+            subscription.closed = True
+            self._changed.notify_all()
+
+    def publish(self, events):
+        """Encode [(event id, line)] once and queue the frames for every subscriber."""
+        items = [(event_id, self.encode(event_id, line)) for event_id, line in events]
+        if not items:
+            return
+        with self._changed:
+            self.published += len(items)
+            for subscription in list(self._subscribers):
+                if not subscription._offer(items):
+                    self._subscribers.discard(subscription)
+                    subscription.closed = True
+                    self.disconnected += 1
+            self._changed.notify_all()
+
+    def start_relay(self, store):
+        """Publish every new event added to an EventStore from a background thread.
+
+        Only one relay runs per hub; calling this again is a no-op while it is alive.
+        """
+        with self._relay_lock:
+            if self._relay is None or not self._relay.is_alive():
+                self._relay = threading.Thread(target=self._run_relay, args=(store,), name="broadcast-relay", daemon=True)
+                self._relay.start()
+
+    def stats(self):
+        with self._changed:
+            subscribers = list(self._subscribers)
+        return {
+            "subscribers": len(subscribers),
+            "published": self.published,
+            "disconnected": self.disconnected,
+            "dropped": sum(subscription.dropped for subscription in subscribers),
+            "queued": sum(len(subscription) for subscription in subscribers)
+        }
+
+    def _run_relay(self, store):
+        last_id = store.last_id
+        while True:
+            store.wait(last_id)
+            events = store.events_since(last_id)
+            if events:
+                self.publish(events)
+                last_id = events[-1][0]
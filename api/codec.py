@@ -0,0 +1,59 @@
+import json
+import os
+
+from flask.json.provider import JSONProvider
+
+# Fastest available JSON library, unless JSON_CODEC forces one ("orjson", "ujson" or "stdlib")
+CODEC_PREFERENCE = ["orjson", "ujson", "stdlib"]
+
+
+def _load_codec(name):
+    """Return (loads, dumps) for a codec, where dumps produces compact UTF-8 bytes."""
+    if name == "orjson":
+        import orjson
+
+        def dumps(obj):
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+        return orjson.loads, dumps
+
+    if name == "ujson":
+        import ujson
+
+        def dumps(obj):
+            return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False).encode()
+
+        return ujson.loads, dumps
+
+    def dumps(obj):
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+    return json.loads, dumps
+
+
+def _select_codec():
+    forced = os.environ.get("JSON_CODEC")
+    for name in [forced] if forced else CODEC_PREFERENCE:
+        try:
+            return (name,) + _load_codec(name)
+        except ImportError:
+            continue
+    return ("stdlib",) + _load_codec("stdlib")
+
+
+CODEC_NAME, loads, dumps = _select_codec()
+
+
+class CodecJSONProvider(JSONProvider):
+    """Flask JSON provider that encodes responses with the selected codec."""
+
+    def dumps(self, obj, **kwargs):
+        return dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return loads(s)
+
+    def response(self, *args, **kwargs):
+        # Hand the encoded bytes straight to the response instead of going through str
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumps(obj), mimetype="application/json")
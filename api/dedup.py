@@ -0,0 +1,118 @@
+import hashlib
+import math
+import threading
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over byte-string keys."""
+
+    def __init__(self, size_bytes, error_rate):
+        self.bits = size_bytes * 8
+        self.error_rate = error_rate
+        # Keys it holds before the false-positive rate climbs past error_rate
+        self.capacity = max(1, int(self.bits * math.log(2) ** 2 / -math.log(error_rate)))
+        self.hash_count = max(1, round(self.bits / self.capacity * math.log(2)))
+        self.count = 0
+        self._array = bytearray(size_bytes)
+
+    def __contains__(self, key):
+        return self.has_bits(self.bit_positions(key))
+
+    def add(self, key):
+        self.set_bits(self.bit_positions(key))
+
+    def has_bits(self, positions):
+        array = self._array
+        for bit in positions:
+            if not array[bit >> 3] & (1 << (bit & 7)):
+                return False
+        return True
+
+    def set_bits(self, positions):
+        array = self._array
+        for bit in positions:
+            array[bit >> 3] |= 1 << (bit & 7)
+        self.count += 1
+
+    def full(self):
+        return self.count >= self.capacity
+
+    def bit_positions(self, key):
+        """Bit indexes for a key; filters of the same size share them."""
+        # Double hashing: k positions from two 64-bit halves of one digest
+        digest = hashlib.blake2b(key, digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.bits for i in range(self.hash_count)]
+
+
+class SeenFilter:
+    """Remembers which signatures have already been emitted.
+
+    The most recent ones are kept exactly in a bounded set; when they age
+    out they move into a Bloom filter. The Bloom memory is split across two
+    generations, and the older one is dropped when the newer fills, so the
+    false-positive rate stays near error_rate on an endless stream. History
+    older than both generations is forgotten.
+    """
+
+    def __init__(self, recent_size=10000, bloom_bytes=1 << 20, error_rate=1e-4):
+        self.recent_size = recent_size
+        self.bloom_bytes = bloom_bytes
+        self.error_rate = error_rate
+
+        # dict keeps insertion order, so the first key is always the oldest
+        self._recent = {}
+        self._current = BloomFilter(bloom_bytes // 2, error_rate)
+        self._previous = None
+        self._lock = threading.Lock()
+
+        self.checked = 0
+        self.duplicates = 0
+        self.rotations = 0
+
+    def filter(self, keys):
+        """Return the keys not seen before (in order) and remember them."""
+        fresh = []
+        with self._lock:
+            for key in keys:
+                self.checked += 1
+                if key in self._recent or self._in_bloom(key):
+                    self.duplicates += 1
+                    continue
+                self._remember(key)
+                fresh.append(key)
+        return fresh
+
+    def stats(self):
+        return {
+            "recent": len(self._recent),
+            "recent_size": self.recent_size,
+            "bloom_bytes": self.bloom_bytes,
+            "bloom_count": self._current.count + (self._previous.count if self._previous else 0),
+            "bloom_capacity": self._current.capacity,
+            "error_rate": self.error_rate,
+            "checked": self.checked,
+            "duplicates": self.duplicates,
+            "rotations": self.rotations
+        }
+
+    def _in_bloom(self, key):
+        if not self._current.count and self._previous is None:
+            return False
+        # Both generations are the same size, so hash once for both
+        positions = self._current.bit_positions(key)
+        if self._current.has_bits(positions):
+            return True
+        return self._previous is not None and self._previous.has_bits(positions)
+
+    def _remember(self, key):
+        self._recent[key] = None
+        if len(self._recent) > self.recent_size:
+            oldest = next(iter(self._recent))
+            del self._recent[oldest]
+            if self._current.full():
+                self._previous = self._current
+                self._current = BloomFilter(self.bloom_bytes // 2, self.error_rate)
+                self.rotations += 1
+            self._current.add(oldest)
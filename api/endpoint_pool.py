@@ -0,0 +1,105 @@
+import random
+import threading
+import time
+from collections import deque
+
+
+class Endpoint:
+    """Latency and error statistics for one RPC endpoint."""
+
+    def __init__(self, url, alpha=0.2, window=200, failure_threshold=3, cooldown=10.0):
+        self.url = url
+        self.alpha = alpha
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+
+        self.latency_ewma = None
+        self.error_ewma = 0.0
+        self.requests = 0
+        self.errors = 0
+        self.consecutive_failures = 0
+        self.cooldown_until = 0.0
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record_success(self, elapsed):
+        """Fold a successful request's latency (seconds) into the moving averages."""
+        with self._lock:
+            self.requests += 1
+            self.consecutive_failures = 0
+            self._samples.append(elapsed)
+            if self.latency_ewma is None:
+                self.latency_ewma = elapsed
+            else:
+                self.latency_ewma += self.alpha * (elapsed - self.latency_ewma)
+            self.error_ewma -= self.alpha * self.error_ewma
+
+    def record_failure(self):
+        """Count a failed request; repeated failures put the endpoint in cooldown."""
+        with self._lock:
+            self.requests += 1
+            self.errors += 1
+            self.consecutive_failures += 1
+            self.error_ewma += self.alpha * (1.0 - self.error_ewma)
+            if self.consecutive_failures >= self.failure_threshold:
+                self.cooldown_until = time.monotonic() + self.cooldown
+
+    def healthy(self):
+        """An endpoint is healthy unless it is cooling down after repeated failures."""
+        return time.monotonic() >= self.cooldown_until
+
+    def score(self, error_penalty=1.0):
+        """Routing cost in seconds: expected latency plus a penalty for the recent error rate."""
+        # Endpoints we have never measured start at 0 so they get tried early
+        latency = self.latency_ewma or 0.0
+        return latency + error_penalty * self.error_ewma
+
+    def p95(self):
+        """95th percentile of recent successful latencies in seconds, or None without samples."""
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        return samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+
+    def stats(self):
+        p95 = self.p95()
+        return {
+            "url": self.url,
+            "healthy": self.healthy(),
+            "latency_ewma_ms": round(self.latency_ewma * 1000, 2) if self.latency_ewma is not None else None,
+            "p95_ms": round(p95 * 1000, 2) if p95 is not None else None,
+            "error_rate": round(self.error_ewma, 4),
+            "requests": self.requests,
+            "errors": self.errors
+        }
+
+
+class EndpointPool:
+    """Routes requests to the fastest healthy endpoint in a list."""
+
+    def __init__(self, urls, explore=0.05, **endpoint_options):
+        if not urls:
+            raise ValueError("EndpointPool needs at least one URL")
+        self.endpoints = [Endpoint(url, **endpoint_options) for url in urls]
+        # Share of requests sent to a random healthy endpoint so stale stats get refreshed
+        self.explore = explore
+
+    def __len__(self):
+        return len(self.endpoints)
+
+    def ranked(self):
+        """Endpoints best-first: healthy ones by score, then the ones cooling down."""
+        return sorted(self.endpoints, key=lambda endpoint: (not endpoint.healthy(), endpoint.score()))
+
+    def pick(self):
+        """Return the endpoint the next request should go to."""
+        ranked = self.ranked()
+        if len(ranked) > 1 and random.random() < self.explore:
+            healthy = [endpoint for endpoint in ranked if endpoint.healthy()]
+            if healthy:
+                return random.choice(healthy)
+        return ranked[0]
+
+    def stats(self):
+        return [endpoint.stats() for endpoint in self.endpoints]
@@ -0,0 +1,165 @@
+import sys
+import threading
+from array import array
+
+import b58
+import codec
+from payload import Payload
+from narrative import Actions, Names, Phrases, PREFIX, SUFFIXES, SUFFIXES_PER_PHRASE, draw_suffix_ids
+
+
+def decode_suffix_id(suffix_id):
+    """Split a suffix id back into (phrase, name, action); name and action are None when omitted."""
+    phrase_id, variant = divmod(suffix_id, SUFFIXES_PER_PHRASE)
+    if not variant:
+        return Phrases[phrase_id], None, None
+    name_id, action_id = divmod(variant - 1, len(Actions))
+    return Phrases[phrase_id], Names[name_id], Actions[action_id]
+
+
+class EventStore:
+    """Ring buffer of narrative events, each kept as its rendered line.
+
+    Each event is its slot, its line (built once, when it is added, from the
+    signature's base58 text) and a one-byte suffix id naming the
+    phrase/name/action. Snapshots are assembled from the stored lines without
+    any base58 work, and each output format's snapshot is cached until the
+    store changes.
+
+    Every event also gets an id, counting from 1 in arrival order, so
+    streaming readers can ask for exactly the events after the last one
+    they saw.
+    """
+
+    def __init__(self, capacity=1000):
+        self.capacity = capacity
+        self._lines = [None] * capacity
+        self._suffix_ids = array("B", bytes(capacity))
+        self._slots = array("q", bytes(8 * capacity))
+
+        self._start = 0
+        self._count = 0
+        self._lock = threading.Lock()
+        # Signalled on every write, for readers waiting on new events
+        self._changed = threading.Condition(self._lock)
+        # Events ever added; the newest buffered event has this id
+        self.last_id = 0
+        # Bumped on every write; rendered snapshots are valid for one version
+        self.version = 0
+        self._rendered = {}
+
+    def __len__(self):
+        return self._count
+
+    def extend(self, slot, signatures, seed=None):
+        """Add a block's base58 signatures, drawing their phrase/name/action, evicting the oldest when full."""
+        suffix_ids = draw_suffix_ids(len(signatures), seed)
+        lines = [PREFIX + signature + SUFFIXES[suffix_id] for signature, suffix_id in zip(signatures, suffix_ids)]
+
+        with self._lock:
+            for line, suffix_id in zip(lines, suffix_ids):
+                index = (self._start + self._count) % self.capacity
+                if self._count == self.capacity:
+                    self._start = (self._start + 1) % self.capacity
+                else:
+                    self._count += 1
+
+                self._lines[index] = line
+                self._suffix_ids[index] = suffix_id
+                self._slots[index] = slot
+                self.last_id += 1
+            self.version += 1
+            self._changed.notify_all()
+
+    def extend_raw(self, slot, raw_signatures, seed=None):
+        """Like extend(), for signatures as their raw 64 bytes."""
+        self.extend(slot, b58.encode_batch(raw_signatures), seed)
+
+    def render(self, format="lines"):
+        """Return a snapshot in one of RENDERERS' formats, oldest event first."""
+        with self._lock:
+            return self._render(format)
+
+    def snapshot(self, format="lines"):
+        """Return (id of the newest event included, snapshot), taken together so a stream can resume right after it."""
+        with self._lock:
+            return self.last_id, self._render(format)
+
+    def _render(self, format):
+        # Caller holds the lock
+        cached = self._rendered.get(format)
+        if cached is not None and cached[0] == self.version:
+            return cached[1]
+
+        value = RENDERERS[format](self)
+        self._rendered[format] = (self.version, value)
+        return value
+
+    def events_since(self, last_id):
+        """Return [(id, line)] for buffered events newer than last_id, oldest first.
+
+        Events that have already been evicted are skipped.
+        """
+        with self._lock:
+            first_id = self.last_id - self._count + 1
+            start = max(last_id + 1, first_id)
+            return [(event_id, self._lines[(self._start + event_id - first_id) % self.capacity])
+                    for event_id in range(start, self.last_id + 1)]
+
+    def wait(self, last_id, timeout=None):
+        """Block until there is an event newer than last_id; returns False on timeout."""
+        with self._changed:
+            return self._changed.wait_for(lambda: self.last_id > last_id, timeout)
+
+    def memory_bytes(self):
+        """Bytes held by the stored lines and arrays, plus the cached lines and JSON snapshots."""
+        with self._lock:
+            size = (sys.getsizeof(self._lines) + self._suffix_ids.itemsize * len(self._suffix_ids)
+                    + self._slots.itemsize * len(self._slots))
+            size += sum(sys.getsizeof(line) for line in self._lines if line is not None)
+            # Snapshots share the stored line objects; only their own containers are extra
+            for format in ("lines", "json"):
+                cached = self._rendered.get(format)
+                if cached is not None:
+                    size += sys.getsizeof(cached[1])
+            return size
+
+    def _iter_events(self):
+        # Caller holds the lock
+        for n in range(self._count):
+            index = (self._start + n) % self.capacity
+            yield self._slots[index], self._lines[index], self._suffix_ids[index]
+
+
+def _render_lines(store):
+    return [line for _, line, _ in store._iter_events()]
+
+
+def _render_json(store):
+    # Reuses the cached lines snapshot when there is one
+    return codec.dumps(store._render("lines"))
+
+
+def _render_payload(store):
+    # The JSON bytes plus their ETag, hashed once per change
+    return Payload(store._render("json"))
+
+
+def _render_records(store):
+    records = []
+    for slot, line, suffix_id in store._iter_events():
+        # The signature sits between the shared prefix and the event's suffix
+        signature = line[len(PREFIX):len(line) - len(SUFFIXES[suffix_id])]
+        phrase, name, action = decode_suffix_id(suffix_id)
+        records.append({"slot": slot, "signature": signature, "phrase": phrase, "name": name, "action": action})
+    return records
+
+
+# Output formats that share one store: rendered text, the same text as encoded JSON bytes
+# (bare or as an ETagged Payload), and structured records
+RENDERERS = {
+    "lines": _render_lines,
+    "json": _render_json,
+    "payload": _render_payload,
+    "records": _render_records
+}
@@ -0,0 +1,195 @@
+import threading
+import time
+
+import b58
+from events import EventStore
+
+
+class SlotFollower:
+    """Background thread that follows the latest slot and keeps narrative events in a ring buffer.
+
+    HTTP handlers only ever read from the buffer, so their latency no longer
+    depends on the RPC node.
+    """
+
+    def __init__(self, get_latest_slot, fetch_signatures, buffer_size=1000,
+                 poll_interval=0.4, max_slots_per_poll=20, seen=None, max_slot_attempts=5):
+        # get_latest_slot() -> int or None
+        # fetch_signatures(slots) -> {slot: [signatures] or None}; failed slots are left out
+        # seen: optional SeenFilter so a transaction is never pushed twice
+        self.get_latest_slot = get_latest_slot
+        self.fetch_signatures = fetch_signatures
+        self.poll_interval = poll_interval
+        self.max_slots_per_poll = max_slots_per_poll
+        # A slot that keeps failing is given up on after this many fetches
+        self.max_slot_attempts = max_slot_attempts
+        self._slot_attempts = {}
+
+        # Compact event records; text is rendered only when a handler asks for it
+        self.store = EventStore(buffer_size)
+        self.seen = seen
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._thread = None
+
+        self.latest_slot = None
+        self.processed_slot = None
+        self.fetch_count = 0
+        self.error_count = 0
+        self.failed_slots = 0
+        self.dropped_slots = 0
+        self.invalid_signatures = 0
+        self._poll_failed = False
+        self.last_fetch_ms = None
+        self.avg_fetch_ms = None
+        self.max_fetch_ms = None
+
+    def start(self):
+        """Start the follower thread if it is not already running."""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="slot-follower", daemon=True)
+            self._thread.start()
+
+    def running(self):
+        """True while the follower thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def stop(self, timeout=None):
+        """Ask the follower thread to stop and wait for it."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def notify(self):
+        """Wake the follower right away, e.g. when a slot notification arrives."""
+        self._wake.set()
+
+    def lines(self):
+        """Return a snapshot of the buffered lines, oldest first."""
+        return self.store.render("lines")
+
+    def render(self, format):
+        """Return a snapshot of the buffer in any EventStore output format."""
+        return self.store.render(format)
+
+    def push(self, slot, signatures):
+        """Append a block's events to the ring buffer, dropping the oldest ones when full.
+
+        Signatures the seen filter already knows are skipped.
+        """
+        # Keyed by the signature's ASCII text, so nothing is base58-decoded on this path
+        keys = []
+        for signature in signatures:
+            if b58.is_signature_text(signature):
+                keys.append(signature.encode("ascii"))
+            else:
+                # One malformed signature must not stall ingest
+                self.invalid_signatures += 1
+                print(f"Skipping invalid signature in Slot {slot}: {signature!r}")
+        if self.seen is not None:
+            keys = self.seen.filter(keys)
+        if keys:
+            self.store.extend(slot, [key.decode("ascii") for key in keys])
+
+    def stats(self):
+        """Report buffer depth, lag behind the chain tip and fetch timings."""
+        lag = None
+        if self.latest_slot is not None and self.processed_slot is not None:
+            lag = self.latest_slot - self.processed_slot
+
+        return {
+            "running": self.running(),
+            "buffer_depth": len(self.store),
+            "buffer_size": self.store.capacity,
+            "buffer_bytes": self.store.memory_bytes(),
+            "latest_slot": self.latest_slot,
+            "processed_slot": self.processed_slot,
+            "lag_slots": lag,
+            "fetch_count": self.fetch_count,
+            "error_count": self.error_count,
+            "failed_slots": self.failed_slots,
+            "dropped_slots": self.dropped_slots,
+            "invalid_signatures": self.invalid_signatures,
+            "last_fetch_ms": self.last_fetch_ms,
+            "avg_fetch_ms": self.avg_fetch_ms,
+            "max_fetch_ms": self.max_fetch_ms,
+            "dedup": self.seen.stats() if self.seen is not None else None
+        }
+
+    def poll_once(self):
+        """Check the latest slot and fetch any slots we have not processed yet.
+
+        processed_slot only advances over slots that were fetched (or skipped
+        by the cluster); a failed slot is retried on the next poll, and given
+        up on after max_slot_attempts.
+        """
+        self._poll_failed = True
+        latest = self.get_latest_slot()
+        if latest is None:
+            self.error_count += 1
+            return
+
+        self.latest_slot = latest
+        if self.processed_slot is None:
+            # Start following from the tip instead of replaying history
+            self.processed_slot = latest - 1
+        if latest <= self.processed_slot:
+            self._poll_failed = False
+            return
+
+        # Catch up oldest-first, a bounded number of slots per poll
+        first = self.processed_slot + 1
+        last = min(latest, self.processed_slot + self.max_slots_per_poll)
+        slots = list(range(first, last + 1))
+
+        start = time.perf_counter()
+        results = self.fetch_signatures(slots)
+        self._record_fetch((time.perf_counter() - start) * 1000)
+
+        for slot in slots:
+            if slot not in results:
+                self.failed_slots += 1
+                attempts = self._slot_attempts.get(slot, 0) + 1
+                if attempts < self.max_slot_attempts:
+                    # Stop here so the slot and everything after it are fetched again
+                    self._slot_attempts[slot] = attempts
+                    self.error_count += 1
+                    return
+                self._slot_attempts.pop(slot, None)
+                self.dropped_slots += 1
+                print(f"Giving up on Slot {slot} after {attempts} failed fetches")
+            else:
+                self._slot_attempts.pop(slot, None)
+                signatures = results[slot]
+                if signatures:
+                    self.push(slot, signatures)
+            self.processed_slot = slot
+        self._poll_failed = False
+
+    def _record_fetch(self, elapsed_ms):
+        self.fetch_count += 1
+        self.last_fetch_ms = round(elapsed_ms, 2)
+        if self.avg_fetch_ms is None:
+            self.avg_fetch_ms = self.last_fetch_ms
+        else:
+            # Exponential moving average so the number tracks recent behaviour
+            self.avg_fetch_ms = round(0.8 * self.avg_fetch_ms + 0.2 * elapsed_ms, 2)
+        self.max_fetch_ms = max(self.max_fetch_ms or 0, self.last_fetch_ms)
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.poll_once()
+            except Exception as e:
+                self.error_count += 1
+                self._poll_failed = True
+                print(f"Slot follower error: {e}")
+
+            # Poll again right away while we are behind, otherwise wait for the next slot
+            # (or for notify() when slots are pushed to us); back off after a failed poll
+            if (self._poll_failed or self.latest_slot is None or self.processed_slot is None
+                    or self.processed_slot >= self.latest_slot):
+                self._wake.wait(self.poll_interval)
+                self._wake.clear()
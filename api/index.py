@@ -1,52 +1,118 @@
-from flask import Flask, jsonify
+from flask import Flask, Response, jsonify, request
 from flask_cors import CORS
 import requests
-import random
 import os
 from datetime import datetime
 from telethon import TelegramClient
 import asyncio
 
+from rpc import RpcClient
+from codec import CodecJSONProvider
+from payload import json_payload
+from sse import event_stream, format_event, parse_last_event_id
+from broadcast import Broadcaster
+from narrative import build_signature_strings
+from rate_limit import RateLimiter
+from follower import SlotFollower
+from dedup import SeenFilter
+from block_stream import iter_json_array
+from block_cache import BlockCache
+from slot_provider import LatestSlotProvider
+from ws_ingest import SlotSubscriber
+
 app = Flask(__name__)
-CORS(app)
+CORS(app, expose_headers=["X-Live-Stream", "X-Last-Event-ID"])
+
+# jsonify() encodes with the fastest installed JSON library
+app.json = CodecJSONProvider(app)
 
 # Define the RPC URL
 RPC_URL = "https://api.devnet.solana.com"
+RPC_WS_URL = os.environ.get("RPC_WS_URL", "wss://api.devnet.solana.com")
 
-# List of names to append (only one name will be selected randomly)
-Names = [
-    "Noodles11", "Cupsey", "Kenzo", "Grandfn3", "Spuno", 
-    "Trump3", "mafia", "earl", "gm6"
-]
+# Optional comma-separated list of RPC endpoints; requests are routed to the fastest healthy one
+RPC_URLS = [url.strip() for url in os.environ.get("RPC_URLS", RPC_URL).split(",") if url.strip()]
 
-# Other possible phrases
-Phrases = [
-    "Pump bonding curve completed.",
-    "King of the hill reached."
-]
+# Send a duplicate request to the runner-up endpoint when the first is slower than its p95
+RPC_HEDGE = os.environ.get("RPC_HEDGE") == "1"
 
-def get_latest_slot():
-    """Fetch the latest slot from the Solana network."""
-    payload = {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": "getEpochInfo",
-        "params": []
-    }
+# Ask the RPC node for gzip/deflate responses (set to 0 to request identity encoding)
+RPC_COMPRESSION = os.environ.get("RPC_COMPRESSION", "1") == "1"
 
-    try:
-        # Make the POST request to fetch the epoch info (which contains the latest slot)
-        response = requests.post(RPC_URL, json=payload)
-        response.raise_for_status()  # Raise an exception for HTTP errors
+# Connection pool settings for the shared RPC client
+RPC_POOL_SIZE = int(os.environ.get("RPC_POOL_SIZE", "10"))
+RPC_TIMEOUT = float(os.environ.get("RPC_TIMEOUT", "10"))
+
+# Maximum number of getBlock requests sent in one JSON-RPC batch
+RPC_BATCH_SIZE = int(os.environ.get("RPC_BATCH_SIZE", "20"))
+
+# getBlock transactionDetails level: "signatures" is all the narrative stream needs,
+# "full" (or "accounts") downloads every transaction body as well
+BLOCK_TRANSACTION_DETAILS = os.environ.get("BLOCK_TRANSACTION_DETAILS", "signatures")
+
+# How long a latest-slot lookup is reused, and whether to use the lighter getSlot
+# method instead of getEpochInfo
+LATEST_SLOT_TTL = float(os.environ.get("LATEST_SLOT_TTL", "0.4"))
+LATEST_SLOT_METHOD = os.environ.get("LATEST_SLOT_METHOD", "getEpochInfo")
+
+# Commitment level for block fetches; only finalized blocks never change, so the block cache skips any other level
+BLOCK_COMMITMENT = os.environ.get("BLOCK_COMMITMENT", "finalized")
+
+# Block cache memory budget, and an optional directory that keeps cached blocks across restarts
+# (the oldest files are deleted once it grows past BLOCK_CACHE_DISK_BYTES)
+BLOCK_CACHE_BYTES = int(os.environ.get("BLOCK_CACHE_BYTES", str(64 * 1024 * 1024)))
+BLOCK_CACHE_DIR = os.environ.get("BLOCK_CACHE_DIR")
+BLOCK_CACHE_DISK_BYTES = int(os.environ.get("BLOCK_CACHE_DISK_BYTES", str(1024 * 1024 * 1024)))
+
+# RPC error codes meaning the slot has no block (skipped, or pruned from long-term storage)
+SKIPPED_SLOT_ERROR_CODES = {-32007, -32009}
+
+# Parse getBlock responses incrementally instead of building the whole block in memory
+BLOCK_STREAM_PARSE = os.environ.get("BLOCK_STREAM_PARSE") == "1"
 
-        # Parse the JSON response
-        result = response.json()
+# Outbound request budget per endpoint and per method (requests/second). The defaults follow
+# the public devnet limits (100 per 10s per IP, 40 per 10s per method); 0 disables a limit
+RPC_RATE_LIMIT = float(os.environ.get("RPC_RATE_LIMIT", "10"))
+RPC_METHOD_RATE_LIMIT = float(os.environ.get("RPC_METHOD_RATE_LIMIT", "4"))
+
+# Every outbound RPC request is scheduled through these token buckets, which adapt to 429s
+rpc_limiter = RateLimiter(RPC_RATE_LIMIT, method_rate=RPC_METHOD_RATE_LIMIT) if RPC_RATE_LIMIT else None
+
+# Every RPC call in this module goes through this client so connections are reused
+rpc_client = RpcClient(RPC_URLS, pool_size=RPC_POOL_SIZE, timeout=RPC_TIMEOUT, hedge=RPC_HEDGE,
+                       limiter=rpc_limiter, compress=RPC_COMPRESSION)
+
+# Repeated requests for a slot are answered from here instead of the RPC node
+block_cache = BlockCache(max_bytes=BLOCK_CACHE_BYTES, disk_dir=BLOCK_CACHE_DIR, disk_max_bytes=BLOCK_CACHE_DISK_BYTES)
+
+# Background slot follower settings
+FOLLOWER_BUFFER_SIZE = int(os.environ.get("FOLLOWER_BUFFER_SIZE", "1000"))
+FOLLOWER_POLL_INTERVAL = float(os.environ.get("FOLLOWER_POLL_INTERVAL", "0.4"))
+
+# Seen-signature dedup: an exact set of the most recent signatures, older ones in a Bloom filter
+DEDUP_RECENT_SIZE = int(os.environ.get("DEDUP_RECENT_SIZE", "10000"))
+DEDUP_BLOOM_BYTES = int(os.environ.get("DEDUP_BLOOM_BYTES", str(1 << 20)))
+DEDUP_ERROR_RATE = float(os.environ.get("DEDUP_ERROR_RATE", "0.0001"))
+
+# How the follower learns about new slots: "poll" calls get_latest_slot() on a timer,
+# "websocket" subscribes to slot notifications and only fetches when a slot arrives
+SLOT_INGEST_MODE = os.environ.get("SLOT_INGEST_MODE", "poll")
+
+def fetch_latest_slot(method=LATEST_SLOT_METHOD):
+    """Fetch the latest slot from the Solana network."""
+    try:
+        # Fetch the epoch info (which contains the latest slot) or the bare slot over the pooled client
+        result = rpc_client.call(method)
 
         # Check for errors in the response
         if "error" in result:
-            print(f"Error retrieving epoch info: {result['error']}")
+            print(f"Error retrieving {method}: {result['error']}")
             return None
 
+        # getSlot returns the slot itself
+        if method == "getSlot":
+            return result.get("result")
+
         # Extract the latest slot from the result
         epoch_info = result.get("result", {})
         if epoch_info and "absoluteSlot" in epoch_info:
@@ -59,30 +125,91 @@ def get_latest_slot():
         print(f"Request failed: {e}")
         return None
 
-def process_block_data_and_generate_strings(slot):
+# Concurrent callers share one in-flight request and a short-lived cached value
+latest_slot_provider = LatestSlotProvider(fetch_latest_slot, ttl=LATEST_SLOT_TTL)
+
+def get_latest_slot():
+    """Return the latest slot, reusing a recent lookup when possible."""
+    return latest_slot_provider.get()
+
+def get_block_params(slot, transaction_details=BLOCK_TRANSACTION_DETAILS):
+    """Build the getBlock params for a slot."""
+    return [
+        slot,
+        {
+            "encoding": "json",
+            "commitment": BLOCK_COMMITMENT,
+            "maxSupportedTransactionVersion": 0,
+            "transactionDetails": transaction_details,
+            "rewards": False
+        }
+    ]
+
+def fetch_block_result(slot, transaction_details=BLOCK_TRANSACTION_DETAILS):
+    """Returns the getBlock response for a slot, served from the block cache when possible."""
+    block_data = block_cache.get(slot, BLOCK_COMMITMENT, transaction_details)
+    if block_data is not None:
+        return {"result": block_data}
+
+    result = rpc_client.call("getBlock", get_block_params(slot, transaction_details))
+    if result.get("result"):
+        block_cache.put(slot, BLOCK_COMMITMENT, transaction_details, result["result"])
+    return result
+
+def extract_signatures(block_data):
+    """Return the transaction signatures in a block, or None if it has none."""
+    # transactionDetails="signatures" puts them straight on the block
+    if 'signatures' in block_data:
+        return block_data['signatures']
+
+    if 'transactions' in block_data:
+        signatures = []
+        for tx in block_data['transactions']:
+            if 'transaction' in tx:
+                signatures.extend(tx['transaction'].get('signatures', []))
+        return signatures
+
+    return None
+
+def generate_signature_strings(block_data, slot):
+    """Extracts signatures from a block and generates a string for each signature."""
+    # Extract signatures
+    signatures = extract_signatures(block_data) if block_data else None
+    if signatures is not None:
+        return build_signature_strings(signatures)
+    else:
+        print(f"No transactions found in block data for Slot {slot}.")
+        return None
+
+def stream_block_items(slot, transaction_details=BLOCK_TRANSACTION_DETAILS):
+    """Yields a block's transactions (or signatures) one at a time as the response streams in."""
+    key = 'signatures' if transaction_details == 'signatures' else 'transactions'
+    chunks = rpc_client.call_stream("getBlock", get_block_params(slot, transaction_details))
+    return iter_json_array(chunks, key)
+
+def stream_block_signatures(slot, transaction_details=BLOCK_TRANSACTION_DETAILS):
+    """Collects a block's signatures without ever holding the whole block in memory."""
+    signatures = []
+    for item in stream_block_items(slot, transaction_details):
+        if isinstance(item, str):
+            signatures.append(item)
+        elif 'transaction' in item:
+            signatures.extend(item['transaction'].get('signatures', []))
+    return signatures
+
+def process_block_data_and_generate_strings(slot, transaction_details=BLOCK_TRANSACTION_DETAILS,
+                                            stream=BLOCK_STREAM_PARSE):
     """Fetches block data, extracts signatures, and generates strings for each signature."""
-    payload = {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": "getBlock",
-        "params": [
-            slot,
-            {
-                "encoding": "json",
-                "maxSupportedTransactionVersion": 0,
-                "transactionDetails": "full",
-                "rewards": False
-            }
-        ]
-    }
+    if stream:
+        try:
+            return build_signature_strings(stream_block_signatures(slot, transaction_details))
+        except (requests.RequestException, ValueError) as e:
+            print(f"Streaming block Slot {slot} failed: {e}")
+            return None
 
     try:
-        # Make the POST request to fetch block data
-        response = requests.post(RPC_URL, json=payload)
-        response.raise_for_status()  # Raise an exception for HTTP errors
-
-        # Parse the JSON response
-        result = response.json()
+        # Fetch block data from the cache or over the pooled client
+        result = fetch_block_result(slot, transaction_details)
 
         # Check for errors in the response
         if "error" in result:
@@ -90,45 +217,125 @@ def process_block_data_and_generate_strings(slot):
             return None
 
         block_data = result.get("result", {})
+        return generate_signature_strings(block_data, slot)
 
-        # Extract signatures
-        if block_data and 'transactions' in block_data:
-            signatures = []
-            for tx in block_data['transactions']:
-                if 'transaction' in tx:
-                    signatures.extend(tx['transaction'].get('signatures', []))
-
-            # Generate the string for each signature
-            signature_strings = []
-            for sig in signatures:
-                # Randomly choose a phrase to append
-                phrase = random.choice(Phrases)
-
-                # 40% chance to add name and action
-                if random.random() < 0.4:
-                    # Randomly choose one name from the list to append
-                    name = random.choice(Names)
-
-                    # Randomly choose whether it's a "bought" or "sold" action (50% chance for each)
-                    action = random.choice(["bought", "sold"])
-
-                    # Construct the signature string
-                    signature_str = f"Analyzing and learning from transaction {sig}. {phrase} {name} {action}."
-                else:
-                    # If 60% chance, do not append name and action
-                    signature_str = f"Analyzing and learning from transaction {sig}. {phrase}"
+    except requests.RequestException as e:
+        print(f"Request failed: {e}")
+        return None
 
-                signature_strings.append(signature_str)
+def fetch_slot_strings(slot, transaction_details=BLOCK_TRANSACTION_DETAILS):
+    """Fetches one slot for backfill: strings for the block ([] if empty), None if the slot was skipped.
 
-            return signature_strings
+    Transport and other RPC errors are raised so the backfill engine can retry them.
+    """
+    result = fetch_block_result(slot, transaction_details)
 
-        else:
-            print(f"No transactions found in block data for Slot {slot}.")
+    if "error" in result:
+        if result["error"].get("code") in SKIPPED_SLOT_ERROR_CODES:
             return None
+        raise ValueError(f"Error retrieving block data: {result['error']}")
 
-    except requests.RequestException as e:
-        print(f"Request failed: {e}")
+    block_data = result.get("result")
+    if block_data is None:
         return None
+    return build_signature_strings(extract_signatures(block_data) or [])
+
+def fetch_blocks(slots, batch_size=RPC_BATCH_SIZE, transaction_details=BLOCK_TRANSACTION_DETAILS):
+    """Fetches several blocks using JSON-RPC batches and returns them keyed by slot.
+
+    Skipped slots map to None. Slots that failed (transport or other RPC errors)
+    are left out of the result so callers can tell them apart and retry them.
+    """
+    blocks = {}
+    missing = []
+    for slot in slots:
+        block_data = block_cache.get(slot, BLOCK_COMMITMENT, transaction_details)
+        if block_data is not None:
+            blocks[slot] = block_data
+        else:
+            missing.append(slot)
+
+    # Only slots the cache could not answer go to the RPC node
+    for start in range(0, len(missing), batch_size):
+        chunk = missing[start:start + batch_size]
+
+        try:
+            # One HTTP round trip for the whole chunk
+            calls = [("getBlock", get_block_params(slot, transaction_details)) for slot in chunk]
+            responses = rpc_client.call_batch(calls)
+        except requests.RequestException as e:
+            print(f"Batch request failed for Slots {chunk[0]}-{chunk[-1]}: {e}")
+            continue
+
+        for slot, result in zip(chunk, responses):
+            # Per-item errors only affect that slot; skipped slots are not failures
+            if "error" in result:
+                if result["error"].get("code") in SKIPPED_SLOT_ERROR_CODES:
+                    blocks[slot] = None
+                else:
+                    print(f"Error retrieving block data for Slot {slot}: {result['error']}")
+            else:
+                blocks[slot] = result.get("result")
+                if blocks[slot]:
+                    block_cache.put(slot, BLOCK_COMMITMENT, transaction_details, blocks[slot])
+
+    # Keep the caller's slot order
+    return {slot: blocks[slot] for slot in slots if slot in blocks}
+
+def fetch_block_signatures(slots, batch_size=RPC_BATCH_SIZE, transaction_details=BLOCK_TRANSACTION_DETAILS):
+    """Fetches several blocks and returns just their signatures keyed by slot (None if skipped, absent if failed)."""
+    blocks = fetch_blocks(slots, batch_size, transaction_details)
+    return {
+        slot: extract_signatures(block_data) if block_data else None
+        for slot, block_data in blocks.items()
+    }
+
+def process_blocks_and_generate_strings(slots, batch_size=RPC_BATCH_SIZE,
+                                        transaction_details=BLOCK_TRANSACTION_DETAILS):
+    """Batch version of process_block_data_and_generate_strings, returning strings keyed by slot."""
+    blocks = fetch_blocks(slots, batch_size, transaction_details)
+    return {
+        slot: generate_signature_strings(block_data, slot) if block_data else None
+        for slot, block_data in blocks.items()
+    }
+
+# Pushes slot notifications to the follower in websocket ingest mode
+slot_subscriber = SlotSubscriber(RPC_WS_URL, on_slot=lambda slot, root: slot_follower.notify())
+
+def get_subscribed_slot():
+    """Return the newest slot seen over the WebSocket subscription at our block commitment."""
+    # The root trails the tip but is the slot whose block is already finalized
+    if BLOCK_COMMITMENT == "finalized":
+        return slot_subscriber.latest_root
+    return slot_subscriber.latest_slot
+
+# Follows the chain tip in the background so /api/messages only reads from memory
+slot_follower = SlotFollower(
+    get_subscribed_slot if SLOT_INGEST_MODE == "websocket" else get_latest_slot,
+    fetch_block_signatures,
+    buffer_size=FOLLOWER_BUFFER_SIZE,
+    # Notifications wake the follower, the timer is only a fallback in websocket mode
+    poll_interval=FOLLOWER_POLL_INTERVAL if SLOT_INGEST_MODE != "websocket" else 5.0,
+    max_slots_per_poll=RPC_BATCH_SIZE,
+    seen=SeenFilter(DEDUP_RECENT_SIZE, DEDUP_BLOOM_BYTES, DEDUP_ERROR_RATE)
+)
+
+# Live stream fan-out: each SSE client gets a bounded queue of shared, pre-encoded frames.
+# Policy for a client whose queue is full: "disconnect" (it reconnects and resumes from
+# Last-Event-ID), "drop-oldest" or "drop-newest"
+SSE_QUEUE_SIZE = int(os.environ.get("SSE_QUEUE_SIZE", "256"))
+SSE_SLOW_POLICY = os.environ.get("SSE_SLOW_POLICY", "disconnect")
+broadcaster = Broadcaster(format_event, maxsize=SSE_QUEUE_SIZE, policy=SSE_SLOW_POLICY)
+
+def start_ingest():
+    """Start the background follower and the stream relay, plus the slot subscription in websocket mode."""
+    if SLOT_INGEST_MODE == "websocket":
+        slot_subscriber.start()
+    slot_follower.start()
+    broadcaster.start_relay(slot_follower.store)
+
+if os.environ.get("SLOT_FOLLOWER") == "1":
+    start_ingest()
 
 # Replace with your credentials
 API_ID = '20418380'
@@ -139,11 +346,20 @@ PHONE_NUMBER = '+16266486608'  # The phone number associated with your Telegram
 # Define the chat (can be a username or chat ID)
 CHAT = '@gmgnsignals'
 
-# Create the client
-client = TelegramClient('session_name', API_ID, API_HASH)
+# Session file name; an empty TELEGRAM_SESSION keeps the session in memory
+TELEGRAM_SESSION = os.environ.get("TELEGRAM_SESSION", SESSION_NAME)
+_telegram_client = None
+
+def get_telegram_client():
+    """Create the Telegram client on first use, so importing this module (e.g. from backfill.py) writes no session file."""
+    global _telegram_client
+    if _telegram_client is None:
+        _telegram_client = TelegramClient(TELEGRAM_SESSION or None, API_ID, API_HASH)
+    return _telegram_client
 
 async def get_last_10_messages():
     # Start the client
+    client = get_telegram_client()
 
     # Get the chat entity (user, group, or channel)
     chat = await client.get_entity(CHAT)
@@ -186,40 +402,52 @@ TRANSACTIONS = [
     "Analyzing and learning from transaction 2R1jQyh2imB4x5ZuJxqPvC4pjLoJguuVLnWMrvuJFUP8hsA6JCcfZDgbjxjo13nbCyi2EdMa9BvWhGjcyU6uusfc. King of the hill reached.",
     "Analyzing and learning from transaction LFUSKgXsSCTxjStvtr4yFeSBaoYVArj6QPuFakaPspomEiTvLLfvxQuavFpBXAD8RiQWzeBSAeZnK69WArqvfqm. Pump bonding curve completed.",
     "Analyzing and learning from transaction 4mxXFLCBmt8nZmm1vckdnGo5kFkE5RzruZsL6WmACHrTtWY7zJShvbVRabefSEC6Zdbkz1pS9RTmVZbUWqyGkCwJ. King of the hill reached. gm6 sold."]
+TRANSACTIONS_PAYLOAD = json_payload(TRANSACTIONS)
+
 
+def payload_response(payload):
+    """Send a pre-serialized payload, or an empty 304 when the client's If-None-Match still matches."""
+    response = Response(payload.body, mimetype=payload.mimetype)
+    response.set_etag(payload.etag)
+    response.headers["Cache-Control"] = "no-cache"
+    return response.make_conditional(request)
 
 @app.route('/api/messages', methods=['GET'])
 def get_messages():
-    transactions = [
-    "Analyzing and learning from transaction 5s9JAXTY2bKP9GuvhYQvHt6hJh7ybrGUV5AjwzXgXT8zQUrvdK9UjCRxHbsYReW84SF1HhfYk55DFyPB3wBFvaeZ. King of the hill reached.",
-    "Analyzing and learning from transaction 43QjfEudRfZ6iLk3At7uRLibCS6biAU7CYd6byCvBqatdJmWXtkwuJKH9QZp4vzBkb7ErC1KFq2t7YH5SMwwuWnA. King of the hill reached. Grandfn3 sold.",
-    "Analyzing and learning from transaction tNtPFJfTdmCuLL8rwSxdwczy9yCu2euz4pETnJuoewJuo8X6JLKuqGpUNCr59oJ2J72f2r1Qs76LndWKgyoJoAx. Pump bonding curve completed.",
-    "Analyzing and learning from transaction 468WYaZTyu2wXZsmshyv72SSGQTBx9MEJnQ4eieUHUN21RD78xihE9etWdPEDvibfVwa1tux7TgYyJRcjZAfQfKC. King of the hill reached. gm6 sold.",
-    "Analyzing and learning from transaction 3kytgBHwAuZnibyZz27xTXCqvWBdEc3mMJtXr1PffritJUivQ9EndUjmAsYQmyVPTLUVQvgNg84k44irausCpKfN. Pump bonding curve completed.",
-    "Analyzing and learning from transaction 3NNELAchJj8mLbGUEJQpVu1vq6kXKY6j9okFSYAoG2gwYGdPRUhehAqiB8iCBwNgyF8bxWkZG1CnSPCqBZSur3Yt. Pump bonding curve completed.",
-    "Analyzing and learning from transaction 54VC3H2VGMvA35h9DARmpj37Cfk4JNypV4dzWM7Q5orAp3a4LyBvnW9GL1qgLAyVfP4J8Zq1k3Gtugyx6VYHRrCA. Pump bonding curve completed. Spuno bought.",
-    "Analyzing and learning from transaction 2dxcytiq6oA3mFTTcVA2qLaP71uiKT5SM1sMSpimpY836xe5HJi8V1VgqP48h6jMck9NyQgjfinkJiQDcK6HDA4J. Pump bonding curve completed.",
-    "Analyzing and learning from transaction YeFrmww71wjGDA16V8trKm5D2gsBXXc5V5tTr7SZBfqD1hn7tU8ypib7Dz9ESFDBRFtYx9fo3HxTNUMcd2E29u4. King of the hill reached. Kenzo sold.",
-    "Analyzing and learning from transaction 62eZJ3kkNCPNykurHM3VNVVQy7SzfqRCiv5DnBWtcTZAx2MFjREziMqhWx8aMu9iXqxXA9AsPtUnrDUjHeiMuT5. Pump bonding curve completed.",
-    "Analyzing and learning from transaction 4MMA7YTSDSjJ7y8cqRi6Tpxs4RjY17QzAH7hWogaVr46TPWRF1dbmwuiwUnDJrAAntRzjJxHz2maWdgzNHhLRNfB. Pump bonding curve completed. mafia sold.",
-    "Analyzing and learning from transaction 4AgF2VsEdiS1k9dUc4jWfggbYePWy3DM71PYxuJ8iSNNVLPJHXbaRdmRvvQSaBC4yeAcRw5rXFsXTpPYoDqpV7Sx. Pump bonding curve completed. Cupsey sold.",
-    "Analyzing and learning from transaction 55AzABFH8m5UqikyUDGjd9R4L9tNDxcsqKZmfiztrUyKoCjMNZe5Vme2ZwiS59Smf7ktcNbDMBcPvYU3PeudXFG2. King of the hill reached.",
-    "Analyzing and learning from transaction YGNVuNANcg2iyfqAvLSuQ7zPKNjYj6zQpBdBg8o2dh1ebSm2gqroY8YhGLyAzujTeakqfciuBrhjcvR4m9KgYTB. Pump bonding curve completed. earl sold.",
-    "Analyzing and learning from transaction NdRmofYpvkpbwuoqxMYvedg3tWFjizAcPvfUCb8PxbtntmqHp9hfKwCkZSByyzCnJYXsbUE8ynCg6KcdUNNW3cY. Pump bonding curve completed. Spuno bought.",
-    "Analyzing and learning from transaction 8Jpz2rDukrfdaHH7VeufaRv5fFTummA4wjz8oNs9JzasskMfbV9wgdjEdMSRScreAKJ9qP4XdJzdWbCsvytdUF3. King of the hill reached.",
-    "Analyzing and learning from transaction 51fuK39YpD8DJLaQWZoyYicS7LNq8qErYxiwACaBJPvki8NACbxE7MxJYVhC6fozLX7xQHPzkkMUxsB2JMLCEY6. King of the hill reached.",
-    "Analyzing and learning from transaction 4pTadbsvH8jPa8Us4zfB8rfJxCEg4qaF4VUhtax1AShnTsTdvUvsB3AbZNSxayG4U34zadVLoL5mQfxcj4T4eG9W. Pump bonding curve completed.",
-    "Analyzing and learning from transaction 3Gz77rADUWnioH4GWicHkAVex32XH9QpFvEyVg8ntLt9Fe6vTAsXsDXtL3Awo4QncfBguASh5FDMbTahbjgPXWJk. Pump bonding curve completed.",
-    "Analyzing and learning from transaction 3SFJLACrJJ7ExMxbbahAJ43SLVBj2qyAbwtUYUMb9iRJvQa7EuEknQJFiMJkNzpShF8PuLfGVJrGP7iEePAdENAV. Pump bonding curve completed.",
-    "Analyzing and learning from transaction 5fcSCvzFrDiBYNScPWN7eyrQteFLg4H1j5vzdakQN1GbpwTVVhB1Sa9WD1foFrXaM3wFLXuEQmmregtLWpH4bofq. Pump bonding curve completed. mafia bought.",
-    "Analyzing and learning from transaction 51yT42RqD9Xwq9LennidCd7Gtz9cFffgQiNncbhLQEADHn4Pe2xotNKsoAozhEzPYyDDz2z6wNiADjWXDvZtbTov. King of the hill reached.",
-    "Analyzing and learning from transaction 4Z67ty6igUcq27R8JKGocQVrv5LHHtAbkccBc4eUqekJLrQLd26Wk6jkfoap6BmXT1ayiF8Ggu64tpD2h3UcFHTZ. Pump bonding curve completed. earl bought.",
-    "Analyzing and learning from transaction 3FnqdUVbhCHFjXDhumsM2Gx3XHDGt5mgXRTBjUc7CjLUEJGrBQ7TusSgLGifNR4tF4CoCdTTD9skBS1aCTgANpvv. King of the hill reached.",
-    "Analyzing and learning from transaction 2R1jQyh2imB4x5ZuJxqPvC4pjLoJguuVLnWMrvuJFUP8hsA6JCcfZDgbjxjo13nbCyi2EdMa9BvWhGjcyU6uusfc. King of the hill reached.",
-    "Analyzing and learning from transaction LFUSKgXsSCTxjStvtr4yFeSBaoYVArj6QPuFakaPspomEiTvLLfvxQuavFpBXAD8RiQWzeBSAeZnK69WArqvfqm. Pump bonding curve completed.",
-    "Analyzing and learning from transaction 4mxXFLCBmt8nZmm1vckdnGo5kFkE5RzruZsL6WmACHrTtWY7zJShvbVRabefSEC6Zdbkz1pS9RTmVZbUWqyGkCwJ. King of the hill reached. gm6 sold."]
-    
-    return jsonify(transactions)
+    # Serve the follower's ring buffer, falling back to the recorded lines until it has data.
+    # The buffer's JSON and ETag are computed once per change and shared by every request
+    last_id, payload = slot_follower.store.snapshot("payload")
+    # Events are only ever evicted by newer ones, so any id means the buffer has data
+    response = payload_response(payload if last_id else TRANSACTIONS_PAYLOAD)
+    # Tells the page whether /api/stream has anything to push, so it only opens one when it does,
+    # and which event the snapshot ends at so the stream resumes right after it
+    response.headers["X-Live-Stream"] = "1" if slot_follower.running() else "0"
+    response.headers["X-Last-Event-ID"] = str(last_id)
+    return response
+
+@app.route('/api/stream', methods=['GET'])
+def stream_messages():
+    # Without a running follower (e.g. on a serverless deployment) nothing would ever be pushed;
+    # 204 tells EventSource to stop instead of holding the connection open on keep-alives
+    if not slot_follower.running():
+        return Response(status=204)
+    # Push new lines as Server-Sent Events. EventSource sends Last-Event-ID when it reconnects;
+    # last_event_id in the query string lets a fresh page resume too
+    last_id = parse_last_event_id(request.headers.get("Last-Event-ID") or request.args.get("last_event_id"))
+    broadcaster.start_relay(slot_follower.store)
+    return Response(event_stream(slot_follower.store, broadcaster, last_id), mimetype="text/event-stream",
+                    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+@app.route('/api/stats', methods=['GET'])
+def get_stats():
+    return jsonify({
+        "follower": slot_follower.stats(),
+        "latest_slot": latest_slot_provider.stats(),
+        "slot_subscription": slot_subscriber.stats(),
+        "rpc": rpc_client.stats(),
+        "block_cache": block_cache.stats(),
+        "broadcast": broadcaster.stats()
+    })
 
 
 # def get_messages2():
@@ -268,36 +496,9 @@ def get_messages():
 
 @app.route('/api/functions', methods=['GET'])
 def get_functions():
-    transactions = [
-    "Analyzing and learning from transaction 5s9JAXTY2bKP9GuvhYQvHt6hJh7ybrGUV5AjwzXgXT8zQUrvdK9UjCRxHbsYReW84SF1HhfYk55DFyPB3wBFvaeZ. King of the hill reached.",
-    "Analyzing and learning from transaction 43QjfEudRfZ6iLk3At7uRLibCS6biAU7CYd6byCvBqatdJmWXtkwuJKH9QZp4vzBkb7ErC1KFq2t7YH5SMwwuWnA. King of the hill reached. Grandfn3 sold.",
-    "Analyzing and learning from transaction tNtPFJfTdmCuLL8rwSxdwczy9yCu2euz4pETnJuoewJuo8X6JLKuqGpUNCr59oJ2J72f2r1Qs76LndWKgyoJoAx. Pump bonding curve completed.",
-    "Analyzing and learning from transaction 468WYaZTyu2wXZsmshyv72SSGQTBx9MEJnQ4eieUHUN21RD78xihE9etWdPEDvibfVwa1tux7TgYyJRcjZAfQfKC. King of the hill reached. gm6 sold.",
-    "Analyzing and learning from transaction 3kytgBHwAuZnibyZz27xTXCqvWBdEc3mMJtXr1PffritJUivQ9EndUjmAsYQmyVPTLUVQvgNg84k44irausCpKfN. Pump bonding curve completed.",
-    "Analyzing and learning from transaction 3NNELAchJj8mLbGUEJQpVu1vq6kXKY6j9okFSYAoG2gwYGdPRUhehAqiB8iCBwNgyF8bxWkZG1CnSPCqBZSur3Yt. Pump bonding curve completed.",
-    "Analyzing and learning from transaction 54VC3H2VGMvA35h9DARmpj37Cfk4JNypV4dzWM7Q5orAp3a4LyBvnW9GL1qgLAyVfP4J8Zq1k3Gtugyx6VYHRrCA. Pump bonding curve completed. Spuno bought.",
-    "Analyzing and learning from transaction 2dxcytiq6oA3mFTTcVA2qLaP71uiKT5SM1sMSpimpY836xe5HJi8V1VgqP48h6jMck9NyQgjfinkJiQDcK6HDA4J. Pump bonding curve completed.",
-    "Analyzing and learning from transaction YeFrmww71wjGDA16V8trKm5D2gsBXXc5V5tTr7SZBfqD1hn7tU8ypib7Dz9ESFDBRFtYx9fo3HxTNUMcd2E29u4. King of the hill reached. Kenzo sold.",
-    "Analyzing and learning from transaction 62eZJ3kkNCPNykurHM3VNVVQy7SzfqRCiv5DnBWtcTZAx2MFjREziMqhWx8aMu9iXqxXA9AsPtUnrDUjHeiMuT5. Pump bonding curve completed.",
-    "Analyzing and learning from transaction 4MMA7YTSDSjJ7y8cqRi6Tpxs4RjY17QzAH7hWogaVr46TPWRF1dbmwuiwUnDJrAAntRzjJxHz2maWdgzNHhLRNfB. Pump bonding curve completed. mafia sold.",
-    "Analyzing and learning from transaction 4AgF2VsEdiS1k9dUc4jWfggbYePWy3DM71PYxuJ8iSNNVLPJHXbaRdmRvvQSaBC4yeAcRw5rXFsXTpPYoDqpV7Sx. Pump bonding curve completed. Cupsey sold.",
-    "Analyzing and learning from transaction 55AzABFH8m5UqikyUDGjd9R4L9tNDxcsqKZmfiztrUyKoCjMNZe5Vme2ZwiS59Smf7ktcNbDMBcPvYU3PeudXFG2. King of the hill reached.",
-    "Analyzing and learning from transaction YGNVuNANcg2iyfqAvLSuQ7zPKNjYj6zQpBdBg8o2dh1ebSm2gqroY8YhGLyAzujTeakqfciuBrhjcvR4m9KgYTB. Pump bonding curve completed. earl sold.",
-    "Analyzing and learning from transaction NdRmofYpvkpbwuoqxMYvedg3tWFjizAcPvfUCb8PxbtntmqHp9hfKwCkZSByyzCnJYXsbUE8ynCg6KcdUNNW3cY. Pump bonding curve completed. Spuno bought.",
-    "Analyzing and learning from transaction 8Jpz2rDukrfdaHH7VeufaRv5fFTummA4wjz8oNs9JzasskMfbV9wgdjEdMSRScreAKJ9qP4XdJzdWbCsvytdUF3. King of the hill reached.",
-    "Analyzing and learning from transaction 51fuK39YpD8DJLaQWZoyYicS7LNq8qErYxiwACaBJPvki8NACbxE7MxJYVhC6fozLX7xQHPzkkMUxsB2JMLCEY6. King of the hill reached.",
-    "Analyzing and learning from transaction 4pTadbsvH8jPa8Us4zfB8rfJxCEg4qaF4VUhtax1AShnTsTdvUvsB3AbZNSxayG4U34zadVLoL5mQfxcj4T4eG9W. Pump bonding curve completed.",
-    "Analyzing and learning from transaction 3Gz77rADUWnioH4GWicHkAVex32XH9QpFvEyVg8ntLt9Fe6vTAsXsDXtL3Awo4QncfBguASh5FDMbTahbjgPXWJk. Pump bonding curve completed.",
-    "Analyzing and learning from transaction 3SFJLACrJJ7ExMxbbahAJ43SLVBj2qyAbwtUYUMb9iRJvQa7EuEknQJFiMJkNzpShF8PuLfGVJrGP7iEePAdENAV. Pump bonding curve completed.",
-    "Analyzing and learning from transaction 5fcSCvzFrDiBYNScPWN7eyrQteFLg4H1j5vzdakQN1GbpwTVVhB1Sa9WD1foFrXaM3wFLXuEQmmregtLWpH4bofq. Pump bonding curve completed. mafia bought.",
-    "Analyzing and learning from transaction 51yT42RqD9Xwq9LennidCd7Gtz9cFffgQiNncbhLQEADHn4Pe2xotNKsoAozhEzPYyDDz2z6wNiADjWXDvZtbTov. King of the hill reached.",
-    "Analyzing and learning from transaction 4Z67ty6igUcq27R8JKGocQVrv5LHHtAbkccBc4eUqekJLrQLd26Wk6jkfoap6BmXT1ayiF8Ggu64tpD2h3UcFHTZ. Pump bonding curve completed. earl bought.",
-    "Analyzing and learning from transaction 3FnqdUVbhCHFjXDhumsM2Gx3XHDGt5mgXRTBjUc7CjLUEJGrBQ7TusSgLGifNR4tF4CoCdTTD9skBS1aCTgANpvv. King of the hill reached.",
-    "Analyzing and learning from transaction 2R1jQyh2imB4x5ZuJxqPvC4pjLoJguuVLnWMrvuJFUP8hsA6JCcfZDgbjxjo13nbCyi2EdMa9BvWhGjcyU6uusfc. King of the hill reached.",
-    "Analyzing and learning from transaction LFUSKgXsSCTxjStvtr4yFeSBaoYVArj6QPuFakaPspomEiTvLLfvxQuavFpBXAD8RiQWzeBSAeZnK69WArqvfqm. Pump bonding curve completed.",
-    "Analyzing and learning from transaction 4mxXFLCBmt8nZmm1vckdnGo5kFkE5RzruZsL6WmACHrTtWY7zJShvbVRabefSEC6Zdbkz1pS9RTmVZbUWqyGkCwJ. King of the hill reached. gm6 sold."]
-    
-    return jsonify(transactions)
+    # Same recorded lines as the /api/messages fallback, serialized once at import
+    return payload_response(TRANSACTIONS_PAYLOAD)
 
 if __name__ == '__main__':
+    start_ingest()
     app.run()
@@ -0,0 +1,65 @@
+import random
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# List of names to append (only one name will be selected randomly)
+Names = [
+    "Noodles11", "Cupsey", "Kenzo", "Grandfn3", "Spuno",
+    "Trump3", "mafia", "earl", "gm6"
+]
+
+# Other possible phrases
+Phrases = [
+    "Pump bonding curve completed.",
+    "King of the hill reached."
+]
+
+# Actions that go with a name (50% chance for each)
+Actions = ["bought", "sold"]
+
+PREFIX = "Analyzing and learning from transaction "
+
+# 40% chance to add name and action
+NAME_CHANCE = 0.4
+
+# Every possible line ending, indexed by phrase_id * SUFFIXES_PER_PHRASE + variant, where
+# variant 0 is the phrase alone and 1 + name_id * len(Actions) + action_id adds a name and action
+SUFFIXES_PER_PHRASE = 1 + len(Names) * len(Actions)
+SUFFIXES = [
+    f". {phrase} {name} {action}." if variant else f". {phrase}"
+    for phrase in Phrases
+    for variant, (name, action) in enumerate([(None, None)] + [(n, a) for n in Names for a in Actions])
+]
+
+
+def draw_suffix_ids(count, seed=None):
+    """Draws the phrase/name/action combination for `count` lines in one pass.
+
+    Uses NumPy when it is installed and the random module otherwise; a given
+    seed is reproducible within one backend, not across both.
+    """
+    if np is not None:
+        rng = np.random.default_rng(seed)
+        phrase_ids = rng.integers(0, len(Phrases), count)
+        with_name = rng.random(count) < NAME_CHANCE
+        variants = 1 + rng.integers(0, len(Names), count) * len(Actions) + rng.integers(0, len(Actions), count)
+        return (phrase_ids * SUFFIXES_PER_PHRASE + np.where(with_name, variants, 0)).tolist()
+
+    rng = random.Random(seed)
+    suffix_ids = []
+    for _ in range(count):
+        suffix_id = rng.randrange(len(Phrases)) * SUFFIXES_PER_PHRASE
+        if rng.random() < NAME_CHANCE:
+            suffix_id += 1 + rng.randrange(len(Names)) * len(Actions) + rng.randrange(len(Actions))
+        suffix_ids.append(suffix_id)
+    return suffix_ids
+
+
+def build_signature_strings(signatures, seed=None):
+    """Generates a narrative string for each signature."""
+    signatures = list(signatures)
+    suffix_ids = draw_suffix_ids(len(signatures), seed)
+    return [PREFIX + sig + SUFFIXES[suffix_id] for sig, suffix_id in zip(signatures, suffix_ids)]
@@ -0,0 +1,20 @@
+import hashlib
+
+import codec
+
+
+class Payload:
+    """A response body serialized once, with a strong ETag from its content hash."""
+
+    def __init__(self, body, mimetype="application/json"):
+        self.body = body
+        self.mimetype = mimetype
+        self.etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+
+    def __len__(self):
+        return len(self.body)
+
+
+def json_payload(obj):
+    """Encode an object with the selected JSON codec into a Payload."""
+    return Payload(codec.dumps(obj))
@@ -0,0 +1,135 @@
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+
+class TokenBucket:
+    """Token bucket whose rate adapts to throttling (AIMD).
+
+    Callers reserve tokens up front and sleep off any deficit, so requests
+    queue up in arrival order instead of failing. A 429 halves the rate and
+    blocks the bucket for Retry-After; each success creeps the rate back up
+    towards the configured ceiling.
+    """
+
+    def __init__(self, rate, burst=None, min_rate=0.2, increase=0.02):
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = burst or max(rate, 1.0)
+        self.min_rate = min_rate
+        # Additive increase per success, as a fraction of the ceiling
+        self.increase = increase
+
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
+
+        self.throttled = 0
+        self.waits = 0
+        self.wait_seconds = 0.0
+
+    def reserve(self, cost=1):
+        """Take `cost` tokens and return how long the caller must wait before sending."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+            # Tokens may go negative: that debt is what later callers queue behind
+            self.tokens -= cost
+            wait = max(self.blocked_until - now, -self.tokens / self.rate if self.tokens < 0 else 0.0)
+            if wait > 0:
+                self.waits += 1
+                self.wait_seconds += wait
+            return wait
+
+    def on_throttled(self, retry_after=None):
+        """Back off after a 429: halve the rate and pause for Retry-After (or one token)."""
+        with self._lock:
+            self.throttled += 1
+            self.rate = max(self.min_rate, self.rate / 2)
+            pause = retry_after if retry_after is not None else 1.0 / self.rate
+            self.blocked_until = max(self.blocked_until, time.monotonic() + pause)
+            self.tokens = min(self.tokens, 0.0)
+
+    def on_success(self):
+        """Recover the rate a little after a request that was not throttled."""
+        if self.rate < self.max_rate:
+            with self._lock:
+                self.rate = min(self.max_rate, self.rate + self.increase * self.max_rate)
+
+    def stats(self):
+        return {
+            "rate": round(self.rate, 3),
+            "max_rate": self.max_rate,
+            "throttled": self.throttled,
+            "waits": self.waits,
+            "wait_seconds": round(self.wait_seconds, 3)
+        }
+
+
+class RateLimiter:
+    """Central scheduler holding one token bucket per endpoint and per (endpoint, method)."""
+
+    def __init__(self, endpoint_rate, method_rate=None, method_rates=None):
+        self.endpoint_rate = endpoint_rate
+        self.method_rate = method_rate
+        # Per-method overrides, e.g. {"getBlock": 2}
+        self.method_rates = method_rates or {}
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, url, methods):
+        """Block until one request carrying `methods` (a list of method names) may be sent to `url`."""
+        wait = 0.0
+        for bucket, cost in self._buckets_for(url, methods):
+            wait = max(wait, bucket.reserve(cost))
+        if wait > 0:
+            time.sleep(wait)
+
+    def on_throttled(self, url, methods, retry_after=None):
+        for bucket, _ in self._buckets_for(url, methods):
+            bucket.on_throttled(retry_after)
+
+    def on_success(self, url, methods):
+        for bucket, _ in self._buckets_for(url, methods):
+            bucket.on_success()
+
+    def stats(self):
+        # Snapshot under the lock: request threads may be adding buckets for new (endpoint, method) pairs
+        with self._lock:
+            items = list(self._buckets.items())
+        return {" ".join(key): bucket.stats() for key, bucket in items}
+
+    def _buckets_for(self, url, methods):
+        counts = Counter(methods)
+        buckets = [(self._bucket((url,), self.endpoint_rate), sum(counts.values()))]
+        for method, count in counts.items():
+            rate = self.method_rates.get(method, self.method_rate)
+            if rate:
+                buckets.append((self._bucket((url, method), rate), count))
+        return buckets
+
+    def _bucket(self, key, rate):
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.setdefault(key, TokenBucket(rate))
+        return bucket
+
+
+def parse_retry_after(value):
+    """Parse a Retry-After header (seconds or an HTTP date) into seconds, or None."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,209 @@
+import itertools
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import requests
+from requests.adapters import HTTPAdapter
+
+import codec
+from endpoint_pool import EndpointPool
+from rate_limit import parse_retry_after
+
+
+class RpcClient:
+    """Shared JSON-RPC client that keeps pooled keep-alive connections to the RPC node.
+
+    `url` may be a single endpoint or a list. With several endpoints each
+    request goes to the fastest healthy one, and with `hedge` enabled a
+    duplicate is sent to the runner-up if the first has not answered within
+    its recent p95 latency.
+    """
+
+    def __init__(self, url, pool_size=10, timeout=10.0, connect_timeout=3.05,
+                 hedge=False, hedge_min_delay=0.05, limiter=None, max_throttle_retries=5,
+                 compress=True):
+        urls = [url] if isinstance(url, str) else list(url)
+        self.endpoints = EndpointPool(urls)
+        self.pool_size = pool_size
+        self.hedge = hedge and len(urls) > 1
+        self.hedge_min_delay = hedge_min_delay
+        self.hedges_sent = 0
+        self.hedges_won = 0
+        # Counters are bumped from the hedging executor and from concurrent callers
+        self._lock = threading.Lock()
+        # Optional RateLimiter; throttled (429) requests are queued and retried rather than failed
+        self.limiter = limiter
+        self.max_throttle_retries = max_throttle_retries
+        # requests takes a (connect, read) tuple so a dead node fails fast on connect
+        self.timeout = (connect_timeout, timeout)
+        self._ids = itertools.count(1)
+
+        # One session per client: the adapter keeps up to pool_size sockets open
+        # so repeated calls reuse the TCP+TLS connection instead of handshaking again
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=len(urls), pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"Connection": "keep-alive", "Content-Type": "application/json"})
+
+        # Block JSON compresses ~10x. urllib3 decompresses gzip/deflate as the body is read,
+        # including chunk by chunk for streamed responses, so parsers only ever see plain JSON
+        self.compress = compress
+        self.session.headers["Accept-Encoding"] = "gzip, deflate" if compress else "identity"
+        self.bytes_on_wire = 0
+        self.bytes_decoded = 0
+
+        # Hedged requests need a second request in flight while we wait on the first
+        self._executor = ThreadPoolExecutor(max_workers=pool_size) if self.hedge else None
+
+    def build_payload(self, method, params=None):
+        """Build a JSON-RPC request object with a fresh request id."""
+        return {
+            "jsonrpc": "2.0",
+            "id": next(self._ids),
+            "method": method,
+            "params": params if params is not None else []
+        }
+
+    def post(self, payload):
+        """POST a raw JSON-RPC payload and return the decoded JSON body."""
+        if self.hedge:
+            return self._post_hedged(payload)
+        return self._post_to(self.endpoints.pick(), payload)
+
+    def _send(self, endpoint, payload, stream=False):
+        """POST to one endpoint through the rate limiter, waiting out any 429s."""
+        methods = [item["method"] for item in payload] if isinstance(payload, list) else [payload["method"]]
+
+        for attempt in range(self.max_throttle_retries + 1):
+            if self.limiter is not None:
+                self.limiter.acquire(endpoint.url, methods)
+
+            start = time.perf_counter()
+            try:
+                response = self.session.post(endpoint.url, data=codec.dumps(payload),
+                                             timeout=self.timeout, stream=stream)
+            except requests.RequestException:
+                endpoint.record_failure()
+                raise
+
+            if response.status_code == 429 and self.limiter is not None and attempt < self.max_throttle_retries:
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                self.limiter.on_throttled(endpoint.url, methods, retry_after)
+                response.close()
+                continue
+
+            try:
+                response.raise_for_status()  # Raise an exception for HTTP errors
+            except requests.RequestException:
+                endpoint.record_failure()
+                response.close()
+                raise
+
+            if self.limiter is not None:
+                self.limiter.on_success(endpoint.url, methods)
+            # Streamed responses are timed to the headers, others to the full body below
+            return response, start
+
+    def _post_to(self, endpoint, payload):
+        response, start = self._send(endpoint, payload)
+        try:
+            result = codec.loads(response.content)
+        except ValueError as e:
+            endpoint.record_failure()
+            # Keep surfacing bad JSON as a RequestException, like response.json() did
+            raise requests.exceptions.InvalidJSONError(f"Invalid JSON from {endpoint.url}: {e}") from e
+        endpoint.record_success(time.perf_counter() - start)
+        self._count_bytes(response, len(response.content))
+        return result
+
+    def _count_bytes(self, response, decoded):
+        # raw.tell() counts bytes read off the socket, before decompression
+        with self._lock:
+            self.bytes_on_wire += response.raw.tell()
+            self.bytes_decoded += decoded
+
+    def _post_hedged(self, payload):
+        primary, secondary = self.endpoints.ranked()[:2]
+        pending = {self._executor.submit(self._post_to, primary, payload)}
+
+        # Give the primary its usual p95 to answer before duplicating the request
+        delay = max(primary.p95() or self.hedge_min_delay, self.hedge_min_delay)
+        done, _ = wait(pending, timeout=delay)
+        if done and next(iter(done)).exception() is None:
+            return next(iter(done)).result()
+
+        # Too slow (or already failed): race the runner-up against it
+        hedge = self._executor.submit(self._post_to, secondary, payload)
+        pending.add(hedge)
+        with self._lock:
+            self.hedges_sent += 1
+
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is hedge:
+                        with self._lock:
+                            self.hedges_won += 1
+                    return future.result()
+                error = future.exception()
+        raise error
+
+    def call(self, method, params=None):
+        """Send a single JSON-RPC request and return the full response object."""
+        return self.post(self.build_payload(method, params))
+
+    def call_stream(self, method, params=None, chunk_size=65536):
+        """Send a single JSON-RPC request and yield the raw response body in chunks."""
+        endpoint = self.endpoints.pick()
+        response, start = self._send(endpoint, self.build_payload(method, params), stream=True)
+        # Streams are routed but never hedged; latency is measured to the response headers
+        endpoint.record_success(time.perf_counter() - start)
+
+        decoded = 0
+        try:
+            for chunk in response.iter_content(chunk_size):
+                decoded += len(chunk)
+                yield chunk
+        finally:
+            self._count_bytes(response, decoded)
+            # Hand the connection back to the pool even if the caller stops early
+            response.close()
+
+    def call_batch(self, calls):
+        """Send (method, params) pairs as one JSON-RPC batch array.
+
+        Returns one response object per call, in call order.
+        """
+        payloads = [self.build_payload(method, params) for method, params in calls]
+        responses = self.post(payloads)
+
+        # A node that rejects the whole batch answers with a single error object
+        if isinstance(responses, dict):
+            return [responses for _ in payloads]
+
+        # Batch responses may come back in any order, so match them up by id
+        by_id = {response.get("id"): response for response in responses}
+        missing = {"error": {"code": -32603, "message": "No response for request in batch"}}
+        return [by_id.get(payload["id"], missing) for payload in payloads]
+
+    def stats(self):
+        """Per-endpoint latency/error stats plus hedging counters."""
+        return {
+            "endpoints": self.endpoints.stats(),
+            "hedging": self.hedge,
+            "hedges_sent": self.hedges_sent,
+            "hedges_won": self.hedges_won,
+            "bytes_on_wire": self.bytes_on_wire,
+            "bytes_decoded": self.bytes_decoded,
+            "rate_limits": self.limiter.stats() if self.limiter is not None else None
+        }
+
+    def close(self):
+        """Close all pooled connections."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+        self.session.close()
@@ -0,0 +1,81 @@
+import threading
+import time
+
+
+class _Flight:
+    """One in-progress fetch that concurrent callers can wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+
+
+class LatestSlotProvider:
+    """Caches the latest slot for a short TTL and coalesces concurrent lookups.
+
+    Slots advance roughly every 400 ms, so callers inside the TTL get the
+    cached value, and callers arriving while a fetch is in flight wait for
+    that fetch instead of sending their own request.
+    """
+
+    def __init__(self, fetch, ttl=0.4):
+        # fetch() -> int or None
+        self.fetch = fetch
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._flight = None
+        self._value = None
+        self._fetched_at = 0.0
+
+        self.hits = 0
+        self.fetches = 0
+        self.coalesced = 0
+        self.errors = 0
+
+    def get(self):
+        """Return the latest slot, or None if it could not be fetched."""
+        with self._lock:
+            if self._value is not None and time.monotonic() - self._fetched_at < self.ttl:
+                self.hits += 1
+                return self._value
+
+            leader = self._flight is None
+            if leader:
+                self._flight = _Flight()
+            else:
+                self.coalesced += 1
+            flight = self._flight
+
+        # Followers just wait for the leader's answer
+        if not leader:
+            flight.done.wait()
+            return flight.value
+
+        value = None
+        try:
+            value = self.fetch()
+        finally:
+            with self._lock:
+                self.fetches += 1
+                if value is None:
+                    self.errors += 1
+                else:
+                    self._value = value
+                    self._fetched_at = time.monotonic()
+                self._flight = None
+            flight.value = value
+            flight.done.set()
+        return value
+
+    def stats(self):
+        """Report the cached value, hit rate and how many callers were coalesced."""
+        lookups = self.hits + self.fetches + self.coalesced
+        return {
+            "latest_slot": self._value,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "fetches": self.fetches,
+            "coalesced_waiters": self.coalesced,
+            "errors": self.errors,
+            "hit_rate": round((self.hits + self.coalesced) / lookups, 4) if lookups else None
+        }
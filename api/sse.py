@@ -0,0 +1,58 @@
+import codec
+
+# Clients reconnect after this many milliseconds when the stream drops
+RETRY_MS = 3000
+
+
+def parse_last_event_id(value):
+    """Parse a Last-Event-ID header or query value; None when absent or invalid."""
+    try:
+        return int(value) if value else None
+    except ValueError:
+        return None
+
+
+def format_event(event_id, data):
+    """Encode one SSE event; data is JSON-encoded so it always fits on one line."""
+    return b"id: %d\ndata: %s\n\n" % (event_id, codec.dumps(data))
+
+
+def event_stream(store, hub, last_id=None, heartbeat=15.0):
+    """Yield an EventStore's new events as Server-Sent Events until the client goes away.
+
+    With last_id (from a reconnecting client's Last-Event-ID) the stream
+    first replays every buffered event after it from the store; without one
+    it starts at the newest event. An id from before a server restart is
+    ahead of the store, so that client gets the whole buffer instead. Live
+    events come from a Broadcaster subscription, whose frames are encoded
+    once for every client; if the hub disconnects a slow client, it
+    reconnects and resumes from its Last-Event-ID.
+    """
+    # Subscribe before replaying so nothing published in between is missed
+    subscription = hub.subscribe()
+    try:
+        if last_id is None:
+            last_id = store.last_id
+        elif last_id > store.last_id:
+            last_id = 0
+
+        yield b"retry: %d\n\n" % RETRY_MS
+        events = store.events_since(last_id)
+        if events:
+            yield b"".join(format_event(event_id, line) for event_id, line in events)
+            last_id = events[-1][0]
+
+        while True:
+            items = subscription.get(heartbeat)
+            if subscription.closed:
+                break
+            # Skip frames the replay already covered
+            frames = [frame for event_id, frame in items if event_id > last_id]
+            if frames:
+                yield b"".join(frames)
+                last_id = items[-1][0]
+            elif not items:
+                # A comment line keeps proxies from closing an idle connection
+                yield b": keep-alive\n\n"
+    finally:
+        subscription.close()
@@ -0,0 +1,121 @@
+import asyncio
+import json
+import threading
+import time
+
+import websockets
+
+
+class SlotSubscriber:
+    """Follows new slots over the Solana WebSocket API (slotSubscribe).
+
+    Runs its own event loop in a background thread, calls `on_slot(slot, root)`
+    for every notification, and reconnects and resubscribes with backoff
+    whenever the connection drops or goes quiet.
+    """
+
+    def __init__(self, ws_url, on_slot=None, reconnect_delay=0.5, max_reconnect_delay=30.0,
+                 idle_timeout=10.0):
+        self.ws_url = ws_url
+        self.on_slot = on_slot
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        # No notification for this long means the subscription is dead even if the socket isn't
+        self.idle_timeout = idle_timeout
+
+        self.latest_slot = None
+        self.latest_root = None
+        self.connected = False
+        self.notifications = 0
+        self.reconnects = 0
+        self.last_notification_at = None
+
+        self._loop = None
+        self._task = None
+        self._thread = None
+
+    def start(self):
+        """Start the subscriber thread if it is not already running."""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run_thread, name="slot-subscriber", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout=None):
+        """Cancel the subscription loop and wait for the thread to exit."""
+        if self._loop is not None and self._task is not None:
+            self._loop.call_soon_threadsafe(self._task.cancel)
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def stats(self):
+        """Report connection state, notification counts and the newest slot seen."""
+        age = None
+        if self.last_notification_at is not None:
+            age = round(time.monotonic() - self.last_notification_at, 3)
+        return {
+            "ws_url": self.ws_url,
+            "connected": self.connected,
+            "latest_slot": self.latest_slot,
+            "latest_root": self.latest_root,
+            "notifications": self.notifications,
+            "reconnects": self.reconnects,
+            "seconds_since_notification": age
+        }
+
+    async def run(self):
+        """Connect, subscribe and dispatch notifications forever, reconnecting on failure."""
+        delay = self.reconnect_delay
+        while True:
+            try:
+                async with websockets.connect(self.ws_url) as ws:
+                    await self._subscribe(ws)
+                    self.connected = True
+                    delay = self.reconnect_delay
+
+                    while True:
+                        message = await asyncio.wait_for(ws.recv(), self.idle_timeout)
+                        self._handle(json.loads(message))
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Slot subscription to {self.ws_url} lost: {e}")
+            finally:
+                self.connected = False
+
+            self.reconnects += 1
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_reconnect_delay)
+
+    async def _subscribe(self, ws):
+        await ws.send(json.dumps({"jsonrpc": "2.0", "id": 1, "method": "slotSubscribe"}))
+        response = json.loads(await asyncio.wait_for(ws.recv(), self.idle_timeout))
+        if "error" in response:
+            raise ConnectionError(f"slotSubscribe failed: {response['error']}")
+
+    def _handle(self, message):
+        if message.get("method") != "slotNotification":
+            return
+
+        result = message["params"]["result"]
+        self.latest_slot = result["slot"]
+        self.latest_root = result.get("root")
+        self.notifications += 1
+        self.last_notification_at = time.monotonic()
+
+        if self.on_slot is not None:
+            try:
+                self.on_slot(self.latest_slot, self.latest_root)
+            except Exception as e:
+                print(f"Slot notification handler failed: {e}")
+
+    def _run_thread(self):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._task = self._loop.create_task(self.run())
+        try:
+            self._loop.run_until_complete(self._task)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._loop.close()
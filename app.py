@@ -1,21 +1,32 @@
 from flask import Flask, jsonify
 from flask_cors import CORS
-from telethon import TelegramClient, sync
+from telethon import TelegramClient, events, sync
 from telethon.tl.types import PeerChannel
 import asyncio
 import os
+import threading
+import time
 from datetime import datetime
 
+from channel_buffer import ChannelBuffer, MessageRing
+from entity_cache import EntityCache
+
+# Response headers listing the channels that made it into /api/messages and the ones that didn't
+CHANNEL_HEADERS = ['X-Channels-Included', 'X-Channels-Failed']
+
 app = Flask(__name__)
-CORS(app)
+CORS(app, expose_headers=CHANNEL_HEADERS)
 
 # Telegram API credentials
 API_ID = '20418380'
 API_HASH = '88928238a385ae34bf1fb8165af0773e'
 
 
+# Session file name; an empty TELEGRAM_SESSION keeps the session in memory
+TELEGRAM_SESSION = os.environ.get("TELEGRAM_SESSION", "session_name")
+
 # Initialize the client
-client = TelegramClient('session_name', API_ID, API_HASH)
+client = TelegramClient(TELEGRAM_SESSION or None, API_ID, API_HASH)
 
 # Channel usernames or IDs to monitor
 CHANNELS = [
@@ -24,6 +35,29 @@ CHANNELS = [
     'channel_username_3'
 ]
 
+# Channels fetched at the same time, and how long one channel may take before it is left out
+CHANNEL_CONCURRENCY = int(os.environ.get("CHANNEL_CONCURRENCY", "4"))
+CHANNEL_TIMEOUT = float(os.environ.get("CHANNEL_TIMEOUT", "5"))
+
+# Resolved channel peers, reused across requests and restarts; an empty path keeps them in memory only
+ENTITY_CACHE_PATH = os.environ.get("ENTITY_CACHE_PATH", "entity_cache.json")
+ENTITY_CACHE_TTL = float(os.environ.get("ENTITY_CACHE_TTL", str(7 * 24 * 3600)))
+entity_cache = EntityCache(lambda channel: client.get_input_entity(channel), ENTITY_CACHE_PATH or None, ENTITY_CACHE_TTL)
+
+# Messages kept per channel, and how often a channel may be asked for newer ones;
+# requests in between are answered from the buffer
+CHANNEL_BUFFER_SIZE = int(os.environ.get("CHANNEL_BUFFER_SIZE", "10"))
+CHANNEL_REFRESH_INTERVAL = float(os.environ.get("CHANNEL_REFRESH_INTERVAL", "2"))
+channel_buffer = ChannelBuffer(CHANNEL_BUFFER_SIZE)
+
+# "poll" fetches channels as requests come in; "events" subscribes to new, edited and deleted
+# messages and serves requests from MESSAGE_RING_SIZE messages kept in memory
+TELEGRAM_INGEST_MODE = os.environ.get("TELEGRAM_INGEST_MODE", "poll")
+MESSAGE_RING_SIZE = int(os.environ.get("MESSAGE_RING_SIZE", "500"))
+message_ring = MessageRing(MESSAGE_RING_SIZE)
+# Channel -> "ok" or "error", as subscribed by start_event_ingest()
+ingest_channels = {}
+
 def format_message(message):
     """Format a Telegram message for JSON response"""
     return {
@@ -36,25 +70,63 @@ def format_message(message):
         'forwards': getattr(message, 'forwards', 0)
     }
 
+async def fetch_channel(channel):
+    """Return one channel's buffered messages, first fetching any newer than its cursor"""
+    now = time.monotonic()
+    if now - channel_buffer.refreshed.get(channel, float('-inf')) < CHANNEL_REFRESH_INTERVAL:
+        return channel_buffer.messages(channel)
+
+    entity = await entity_cache.get(channel)
+    try:
+        # Only messages above the highest id we already have
+        new_messages = await client.get_messages(entity, limit=CHANNEL_BUFFER_SIZE,
+                                                 min_id=channel_buffer.cursor(channel))
+    except Exception:
+        # The cached peer may be stale; resolve it again next time
+        entity_cache.invalidate(channel)
+        raise
+
+    channel_buffer.merge(channel, [format_message(msg) for msg in new_messages], refreshed=now)
+    return channel_buffer.messages(channel)
+
+async def fetch_channel_limited(channel, semaphore):
+    async with semaphore:
+        # The timeout starts once a slot is free, so queued channels aren't penalised
+        return await asyncio.wait_for(fetch_channel(channel), CHANNEL_TIMEOUT)
+
 async def get_channel_messages():
-    """Retrieve messages from multiple channels"""
+    """Retrieve messages from multiple channels concurrently
+
+    Returns (messages, channels): the messages newest first, and a dict
+    mapping each channel to "ok", "timeout" or "error".
+    """
+    if TELEGRAM_INGEST_MODE == "events":
+        # Update handlers keep the ring current; nothing to fetch
+        return message_ring.messages(), dict(ingest_channels)
+
     messages = []
+    channels = {}
     
     try:
         # Connect if not already connected
         if not client.is_connected():
             await client.connect()
-            
-
-        # Fetch messages from each channel
-        for channel in CHANNELS:
-            try:
-                entity = await client.get_entity(channel)
-                channel_messages = await client.get_messages(entity, limit=10)
-                messages.extend([format_message(msg) for msg in channel_messages])
-            except Exception as e:
-                print(f"Error fetching messages from {channel}: {str(e)}")
-                continue
+
+        # Fetch all channels at once, at most CHANNEL_CONCURRENCY in flight;
+        # a failing or slow channel is reported and left out
+        semaphore = asyncio.Semaphore(CHANNEL_CONCURRENCY)
+        results = await asyncio.gather(*(fetch_channel_limited(channel, semaphore) for channel in CHANNELS),
+                                       return_exceptions=True)
+        for channel, result in zip(CHANNELS, results):
+            if isinstance(result, asyncio.TimeoutError):
+                print(f"Timed out fetching messages from {channel}")
+                channels[channel] = "timeout"
+            elif isinstance(result, Exception):
+                print(f"Error fetching messages from {channel}: {str(result)}")
+                channels[channel] = "error"
+            else:
+                messages.extend(result)
+                channels[channel] = "ok"
 
         # Sort all messages by date
         messages.sort(key=lambda x: x['date'], reverse=True)
@@ -63,13 +135,69 @@ async def get_channel_messages():
         print(f"Error in get_channel_messages: {str(e)}")
         raise
 
-    return messages
+    return messages, channels
+
+async def on_new_message(event):
+    # Load the chat onto the message itself (event.get_chat() only caches it on the event)
+    # so format_message can read its username
+    await event.message.get_chat()
+    message_ring.add(event.chat_id, format_message(event.message))
+
+async def on_message_edited(event):
+    await event.message.get_chat()
+    message_ring.edit(event.chat_id, format_message(event.message))
+
+async def on_message_deleted(event):
+    message_ring.remove(event.chat_id, event.deleted_ids)
+
+async def seed_channel(channel):
+    entity = await entity_cache.get(channel)
+    for msg in reversed(await client.get_messages(entity, limit=CHANNEL_BUFFER_SIZE)):
+        message_ring.add(msg.chat_id, format_message(msg))
+
+async def start_event_ingest():
+    """Subscribe to new, edited and deleted messages in CHANNELS and seed the ring buffer"""
+    if not client.is_connected():
+        await client.connect()
+
+    failed = await entity_cache.warm(CHANNELS)
+    subscribed = [channel for channel in CHANNELS if channel not in failed]
+    ingest_channels.update({channel: "error" if channel in failed else "ok" for channel in CHANNELS})
+    # Subscribe with the cached peers so registering costs no extra lookups
+    peers = [await entity_cache.get(channel) for channel in subscribed]
+    client.add_event_handler(on_new_message, events.NewMessage(chats=peers))
+    client.add_event_handler(on_message_edited, events.MessageEdited(chats=peers))
+    client.add_event_handler(on_message_deleted, events.MessageDeleted(chats=peers))
+
+    # Start from the messages already there instead of an empty buffer
+    results = await asyncio.gather(*(seed_channel(channel) for channel in subscribed), return_exceptions=True)
+    for channel, result in zip(subscribed, results):
+        if isinstance(result, Exception):
+            print(f"Error seeding messages from {channel}: {str(result)}")
+
+async def run_event_ingest():
+    await client.start()
+    await start_event_ingest()
+    await client.run_until_disconnected()
+
+def channel_headers(channels):
+    """Headers reporting which channels were included in a response"""
+    return {
+        'X-Channels-Included': ','.join(channel for channel, status in channels.items() if status == "ok"),
+        'X-Channels-Failed': ','.join(f"{channel}={status}" for channel, status in channels.items() if status != "ok")
+    }
+
+FUNCTIONS = [
+    "function example1() { console.log('Example 1'); }",
+    "function example2() { console.log('Example 2'); }",
+    "function example3() { console.log('Example 3'); }"
+]
 
 @app.route('/api/messages', methods=['GET'])
 async def get_messages():
     try:
-        messages = await get_channel_messages()
-        return jsonify(messages)  # Return only the messages list
+        messages, channels = await get_channel_messages()
+        return jsonify(messages), channel_headers(channels)  # The body stays the bare messages list
     except Exception as e:
         return jsonify({
             'error': str(e)
@@ -77,16 +205,18 @@ async def get_messages():
 
 @app.route('/api/functions', methods=['GET'])
 def get_functions():
-    functions = [
-        "function example1() { console.log('Example 1'); }",
-        "function example2() { console.log('Example 2'); }",
-        "function example3() { console.log('Example 3'); }"
-    ]
-    return jsonify(functions)
+    return jsonify(FUNCTIONS)
 
 if __name__ == '__main__':
-    # Start the Telegram client
-    client.start()
+    if TELEGRAM_INGEST_MODE == "events":
+        # The client lives on this thread's loop; requests only read the ring buffer
+        threading.Thread(target=asyncio.run, args=(run_event_ingest(),), name="telegram-ingest", daemon=True).start()
+    else:
+        # Start the Telegram client
+        client.start()
+
+        # Resolve every channel up front so the first request doesn't pay for it
+        client.loop.run_until_complete(entity_cache.warm(CHANNELS))
     
     # Run Flask app with async support
     app.run()
\ No newline at end of file
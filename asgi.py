@@ -0,0 +1,112 @@
+"""ASGI entry point serving the same API as app.py.
+
+Run with `uvicorn asgi:app`. The Telegram client connects once on the
+server's event loop and a background task keeps the channel messages
+fresh (or, with TELEGRAM_INGEST_MODE=events, update handlers do), so
+requests are answered from memory instead of each one spinning up its own
+loop and round-tripping to Telegram.
+"""
+import asyncio
+import json
+import os
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response
+
+from app import (CHANNEL_HEADERS, CHANNELS, FUNCTIONS, TELEGRAM_INGEST_MODE, channel_headers, client, entity_cache,
+                 get_channel_messages, message_ring, start_event_ingest)
+
+# Seconds between background refreshes of the channel messages
+TELEGRAM_REFRESH_INTERVAL = float(os.environ.get("TELEGRAM_REFRESH_INTERVAL", "10"))
+
+
+class MessageCache:
+    """Latest channel messages, encoded once per refresh and shared by every request."""
+
+    def __init__(self):
+        self.body = None
+        self.headers = {}
+        self.refreshed = 0
+        # Ring buffer version the body was encoded from, in events mode
+        self.version = None
+        self._lock = asyncio.Lock()
+
+    async def refresh(self):
+        async with self._lock:
+            messages, channels = await get_channel_messages()
+            self.body = json.dumps(messages).encode()
+            self.headers = channel_headers(channels)
+            self.refreshed += 1
+
+    async def get(self):
+        """Return the encoded messages and their channel headers, fetching them first if no refresh has finished yet."""
+        if TELEGRAM_INGEST_MODE == "events":
+            # Re-encode only when an update handler has changed the ring
+            version = message_ring.version
+            if version != self.version:
+                await self.refresh()
+                self.version = version
+            return self.body, self.headers
+
+        if self.body is None:
+            async with self._lock:
+                pass
+            # A refresh that was in flight may have filled the cache while we waited
+            if self.body is None:
+                await self.refresh()
+        return self.body, self.headers
+
+
+messages_cache = MessageCache()
+functions_body = json.dumps(FUNCTIONS).encode()
+
+
+async def refresh_messages():
+    while True:
+        try:
+            await messages_cache.refresh()
+        except Exception as e:
+            print(f"Error refreshing channel messages: {str(e)}")
+        await asyncio.sleep(TELEGRAM_REFRESH_INTERVAL)
+
+
+@asynccontextmanager
+async def lifespan(app):
+    # Connect on the server's loop; every later Telegram call runs on this same loop
+    try:
+        await client.connect()
+        if TELEGRAM_INGEST_MODE == "events":
+            # Update handlers run on this loop and fill the ring buffer
+            await start_event_ingest()
+        else:
+            # Resolve every channel concurrently before serving
+            await entity_cache.warm(CHANNELS)
+    except Exception as e:
+        print(f"Error connecting Telegram client: {str(e)}")
+    ingest = asyncio.create_task(refresh_messages()) if TELEGRAM_INGEST_MODE != "events" else None
+    try:
+        yield
+    finally:
+        if ingest is not None:
+            ingest.cancel()
+        await client.disconnect()
+
+
+app = FastAPI(lifespan=lifespan)
+app.add_middleware(CORSMiddleware, allow_origins=["*"], expose_headers=CHANNEL_HEADERS)
+
+
+@app.get('/api/messages')
+async def get_messages():
+    try:
+        body, headers = await messages_cache.get()
+        return Response(body, media_type="application/json", headers=headers)
+    except Exception as e:
+        return JSONResponse({'error': str(e)}, status_code=500)
+
+
+@app.get('/api/functions')
+async def get_functions():
+    return Response(functions_body, media_type="application/json")
@@ -0,0 +1,87 @@
+"""Load test: app.py's Flask async route against the ASGI entry point.
+
+Both servers run in this process against the same stub Telegram client.
+Flask runs each async view on a fresh event loop and, with the channel
+refresh interval at 0, fetches from Telegram per request (as app.py did
+before the channel buffer); the ASGI app keeps one loop and serves the
+cache its background task refreshes.
+"""
+import socket
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+import uvicorn
+from werkzeug.serving import make_server
+
+from stub_telegram import StubTelegramClient
+import app as flask_module
+import asgi
+
+REQUESTS = 400
+CONCURRENCY = 16
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_flask():
+    server = make_server("127.0.0.1", 0, flask_module.app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_port}"
+
+
+def start_asgi():
+    port = free_port()
+    server = uvicorn.Server(uvicorn.Config(asgi.app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    return f"http://127.0.0.1:{port}"
+
+
+def load(url, stub):
+    local = threading.local()
+
+    def one(_):
+        session = getattr(local, "session", None)
+        if session is None:
+            session = local.session = requests.Session()
+        start = time.perf_counter()
+        response = session.get(url)
+        response.raise_for_status()
+        return (time.perf_counter() - start) * 1000
+
+    calls, loops = stub.calls, len(stub.loops)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(CONCURRENCY) as pool:
+        latencies = sorted(pool.map(one, range(REQUESTS)))
+    elapsed = time.perf_counter() - start
+    return (f"{REQUESTS / elapsed:8.1f} req/s, p50 {statistics.median(latencies):7.2f} ms, "
+            f"p99 {latencies[int(len(latencies) * 0.99)]:7.2f} ms, "
+            f"{stub.calls - calls} Telegram calls on {len(stub.loops) - loops} new event loop(s)")
+
+
+if __name__ == '__main__':
+    stub = StubTelegramClient(flask_module.CHANNELS)
+    # Both entry points share app.py's module-level client
+    flask_module.client = stub
+    asgi.client = stub
+    # Always go to Telegram from the Flask route, rather than answering from the channel buffer
+    # the ASGI background refresh also fills; bench_incremental.py covers serving from the buffer
+    flask_module.CHANNEL_REFRESH_INTERVAL = 0
+
+    flask_url = start_flask()
+    asgi_url = start_asgi()
+    # Let the ASGI ingest task finish its first refresh
+    time.sleep(0.5)
+
+    print(f"{REQUESTS} requests, {CONCURRENCY} concurrent, {stub.latency * 1000:.0f} ms per Telegram call\n")
+    for path in ("/api/messages", "/api/functions"):
+        print(f"Flask {path:<15} {load(flask_url + path, stub)}")
+        print(f"ASGI  {path:<15} {load(asgi_url + path, stub)}")
@@ -0,0 +1,58 @@
+"""Base58 encode/decode speed, and str vs raw 64-byte signature keys in a set."""
+import hashlib
+import sys
+import time
+
+from stub_rpc import fake_signature
+import b58
+
+COUNT = 20000
+
+
+def naive_encode(data):
+    """Textbook digit-at-a-time base58, as in most pure-Python packages."""
+    n = int.from_bytes(data, "big")
+    text = ""
+    while n:
+        n, digit = divmod(n, 58)
+        text = b58.ALPHABET[digit] + text
+    return "1" * (len(data) - len(data.lstrip(b"\0"))) + text
+
+
+def naive_decode(text):
+    n = 0
+    for char in text:
+        n = n * 58 + b58.ALPHABET.index(char)
+    zeros = len(text) - len(text.lstrip("1"))
+    return b"\0" * zeros + n.to_bytes((n.bit_length() + 7) // 8, "big")
+
+
+def timed(label, function, items):
+    start = time.perf_counter()
+    result = [function(item) for item in items]
+    print(f"{label:<28} {(time.perf_counter() - start) * 1e6 / len(items):8.2f} us/item")
+    return result
+
+
+if __name__ == '__main__':
+    raws = [hashlib.sha512(str(i).encode()).digest() for i in range(COUNT)]
+    texts = [b58.encode(raw) for raw in raws]
+    print(f"based58 accelerated: {'yes' if b58.based58 is not None else 'no'}\n")
+
+    assert timed("encode naive", naive_encode, raws) == texts
+    assert timed("encode chunked (pure)", b58._encode_py, raws) == texts
+    assert timed("encode (selected)", b58.encode, raws) == texts
+    assert timed("decode naive", naive_decode, texts) == raws
+    assert timed("decode chunked (pure)", b58._decode_py, texts) == raws
+    assert timed("decode (selected)", b58.decode, texts) == raws
+
+    print()
+    for label, keys in (("base58 str keys", texts), ("raw 64-byte keys", raws)):
+        size = sum(sys.getsizeof(key) for key in keys) / COUNT
+        start = time.perf_counter()
+        seen = set(keys)
+        hits = sum(1 for key in keys if key in seen)
+        elapsed = (time.perf_counter() - start) * 1e6 / COUNT
+        print(f"{label:<20} {size:6.1f} bytes/key, build+lookup {elapsed:.3f} us/key ({hits} hits)")
+
+    assert fake_signature(1, 1) == fake_signature(1, 1)
@@ -0,0 +1,146 @@
+"""Fan-out cost of the broadcast hub with 1k and 10k subscribers.
+
+Publishes blocks of narrative lines and reports the producer-side fan-out
+time, the wake-up latency seen by consumer threads, and memory per
+subscriber once every queue is full. Under the disconnect policy dropped
+clients reconnect after each block, as EventSource would, so every block
+still fans out to the full set; that row also reports disconnects per
+block. A last row publishes blocks bigger than the queue to clients that
+drain between blocks, which must be neither dropped nor disconnected. Also
+shows what encoding each frame per subscriber (the pre-hub SSE path) would
+cost.
+"""
+import statistics
+import threading
+import time
+import tracemalloc
+
+from stub_rpc import fake_signature
+from narrative import build_signature_strings
+from broadcast import Broadcaster
+from sse import format_event
+
+BLOCK_EVENTS = 20
+# Vote-heavy blocks carry more signatures than a subscriber's queue holds
+BIG_BLOCK_EVENTS = 400
+BLOCKS = 50
+QUEUE_SIZE = 256
+CONSUMER_THREADS = 50
+
+
+def make_blocks(block_events=BLOCK_EVENTS):
+    blocks = []
+    event_id = 0
+    for slot in range(BLOCKS):
+        lines = build_signature_strings([fake_signature(slot, i) for i in range(block_events)], seed=slot)
+        blocks.append([(event_id + n + 1, line) for n, line in enumerate(lines)])
+        event_id += len(lines)
+    return blocks
+
+
+def publish_all(subscribers, blocks, policy, drain=False):
+    hub = Broadcaster(format_event, maxsize=QUEUE_SIZE, policy=policy)
+    subscriptions = [hub.subscribe() for _ in range(subscribers)]
+    timings = []
+    disconnects = 0
+    for block in blocks:
+        start = time.perf_counter()
+        hub.publish(block)
+        timings.append((time.perf_counter() - start) * 1000)
+
+        if drain:
+            # Clients that keep up empty their queue before the next block
+            for subscription in subscriptions:
+                subscription.get(0)
+
+        # Dropped clients come back with a fresh subscription (resuming from Last-Event-ID)
+        for n, subscription in enumerate(subscriptions):
+            if subscription.closed:
+                subscriptions[n] = hub.subscribe()
+                disconnects += 1
+    return subscriptions, timings, disconnects / len(blocks)
+
+
+def bench_fanout(subscribers, blocks, policy):
+    _, timings, disconnects = publish_all(subscribers, blocks, policy)
+
+    # Second run under tracemalloc, which would skew the timings
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    subscriptions, _, _ = publish_all(subscribers, blocks, policy)
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    # Frames are shared: every subscriber's first item is the same bytes object
+    first = {id(subscription._queue[0][1]) for subscription in subscriptions if len(subscription)}
+    timings.sort()
+    print(f"{subscribers:>6} subs {policy:<12} fan-out per {BLOCK_EVENTS}-event block: "
+          f"p50 {statistics.median(timings):7.2f} ms, p99 {timings[int(len(timings) * 0.99)]:7.2f} ms; "
+          f"{used / subscribers / 1024:6.1f} KB/subscriber with {len(subscriptions[0])} queued, "
+          f"{len(first)} distinct frame object(s)"
+          + (f", {disconnects:.0f} disconnects/block" if policy == "disconnect" else ""))
+
+
+def bench_wakeup(subscribers, blocks):
+    """Latency from publish() to consumer threads holding the block."""
+    hub = Broadcaster(format_event, maxsize=QUEUE_SIZE, policy="drop-oldest")
+    subscriptions = [hub.subscribe() for _ in range(subscribers)]
+    latencies = []
+    lock = threading.Lock()
+    published_at = {}
+    stop = threading.Event()
+
+    def consume(mine):
+        while not stop.is_set():
+            for subscription in mine:
+                items = subscription.get(0.05)
+                if items:
+                    elapsed = time.perf_counter() - published_at[items[-1][0]]
+                    with lock:
+                        latencies.append(elapsed * 1000)
+
+    # Each consumer thread drains its share of the subscriptions
+    threads = [threading.Thread(target=consume, args=(subscriptions[n::CONSUMER_THREADS],), daemon=True)
+               for n in range(CONSUMER_THREADS)]
+    for thread in threads:
+        thread.start()
+    for block in blocks[:10]:
+        published_at[block[-1][0]] = time.perf_counter()
+        hub.publish(block)
+        time.sleep(0.2)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    latencies.sort()
+    print(f"{subscribers:>6} subs delivery latency over {CONSUMER_THREADS} consumer threads: "
+          f"p50 {statistics.median(latencies):7.2f} ms, p99 {latencies[int(len(latencies) * 0.99)]:7.2f} ms")
+
+
+def bench_big_blocks(subscribers, blocks, policy):
+    """Blocks bigger than the queue, published to clients that drain between blocks."""
+    subscriptions, timings, disconnects = publish_all(subscribers, blocks, policy, drain=True)
+    dropped = sum(subscription.dropped for subscription in subscriptions)
+    timings.sort()
+    print(f"{subscribers:>6} subs {policy:<12} {BIG_BLOCK_EVENTS}-event blocks, {QUEUE_SIZE}-item queues, draining: "
+          f"p50 {statistics.median(timings):7.2f} ms; {disconnects:.0f} disconnects/block, {dropped} dropped")
+
+
+def bench_encode_per_subscriber(subscribers, block):
+    start = time.perf_counter()
+    for _ in range(subscribers):
+        [format_event(event_id, line) for event_id, line in block]
+    return (time.perf_counter() - start) * 1000
+
+
+if __name__ == '__main__':
+    blocks = make_blocks()
+    big_blocks = make_blocks(BIG_BLOCK_EVENTS)[:10]
+    for subscribers in (1000, 10000):
+        for policy in ("drop-oldest", "drop-newest", "disconnect"):
+            bench_fanout(subscribers, blocks, policy)
+        bench_wakeup(subscribers, blocks)
+        for policy in ("drop-oldest", "drop-newest", "disconnect"):
+            bench_big_blocks(subscribers, big_blocks, policy)
+        print(f"{subscribers:>6} subs encoding each frame per subscriber instead: "
+              f"{bench_encode_per_subscriber(subscribers, blocks[0]):7.2f} ms per block\n")
@@ -0,0 +1,69 @@
+"""Wall time of get_channel_messages() fetching channels one by one vs concurrently.
+
+Uses the stub Telegram client with 50 ms per call, then repeats with one
+channel that hangs to show it is cut off at CHANNEL_TIMEOUT and reported,
+and finally counts Telegram calls per request with a cold and a warm
+entity cache.
+"""
+import asyncio
+import time
+
+from stub_telegram import StubTelegramClient
+import app
+from channel_buffer import ChannelBuffer
+
+LATENCY = 0.05
+
+
+async def sequential(channels):
+    # The loop get_channel_messages() used before: one channel at a time
+    messages = []
+    for channel in channels:
+        entity = await app.client.get_entity(channel)
+        messages.extend(app.format_message(msg) for msg in await app.client.get_messages(entity, limit=10))
+    return messages
+
+
+def timed(coroutine):
+    start = time.perf_counter()
+    result = asyncio.run(coroutine)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def reset(channels, **options):
+    app.CHANNELS = channels
+    app.client = StubTelegramClient(channels, latency=LATENCY, **options)
+    app.client.connected = True
+    app.entity_cache._entries.clear()
+    app.channel_buffer = ChannelBuffer(app.CHANNEL_BUFFER_SIZE)
+
+
+if __name__ == '__main__':
+    # Always go to Telegram; bench_incremental.py covers serving from the buffer
+    app.CHANNEL_REFRESH_INTERVAL = 0
+    for count in (3, 10, 30):
+        channels = [f"@channel{n}" for n in range(count)]
+        reset(channels)
+
+        messages, sequential_ms = timed(sequential(channels))
+        (concurrent, report), concurrent_ms = timed(app.get_channel_messages())
+        assert len(concurrent) == len(messages)
+        print(f"{count:>3} channels: sequential {sequential_ms:7.1f} ms, "
+              f"concurrent (limit {app.CHANNEL_CONCURRENCY}) {concurrent_ms:7.1f} ms")
+
+    channels = ["@fast1", "@hangs", "@fast2"]
+    app.CHANNEL_TIMEOUT = 0.5
+    reset(channels, channel_latency={"@hangs": 30})
+    (messages, report), elapsed = timed(app.get_channel_messages())
+    print(f"\nOne hanging channel, {app.CHANNEL_TIMEOUT}s timeout: {elapsed:.1f} ms, "
+          f"{len(messages)} messages, {app.channel_headers(report)}")
+
+    channels = [f"@channel{n}" for n in range(10)]
+    reset(channels)
+    for label in ("cold entity cache", "warm entity cache"):
+        calls = app.client.calls
+        _, elapsed = timed(app.get_channel_messages())
+        print(f"10 channels, {label}: {app.client.calls - calls} Telegram calls, {elapsed:.1f} ms")
+    app.entity_cache._entries.clear()
+    _, warm_ms = timed(app.entity_cache.warm(channels))
+    print(f"Warming 10 channels concurrently: {warm_ms:.1f} ms")
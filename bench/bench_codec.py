@@ -0,0 +1,46 @@
+"""Decode/encode throughput of each installed JSON codec on representative payloads."""
+import time
+
+from stub_rpc import make_block, START_SLOT
+import codec
+
+ROUNDS = 50
+
+
+def payloads():
+    block = {"jsonrpc": "2.0", "id": 1, "result": make_block(START_SLOT, 1500, "full")}
+    signatures = {"jsonrpc": "2.0", "id": 1, "result": make_block(START_SLOT, 1500, "signatures")}
+    messages = [
+        f"Analyzing and learning from transaction {sig}. King of the hill reached. gm6 sold."
+        for sig in signatures["result"]["signatures"]
+    ]
+    return [
+        ("getBlock full (decode)", "decode", codec.dumps(block)),
+        ("getBlock signatures (decode)", "decode", codec.dumps(signatures)),
+        ("/api/messages 1500 lines (encode)", "encode", messages),
+        ("/api/stats (encode)", "encode", {"follower": {"lag_slots": 0, "buffer_depth": 1000},
+                                           "rpc": {"endpoints": [{"url": "x", "p95_ms": 1.5}] * 3}})
+    ]
+
+
+def run(loads, dumps, mode, payload):
+    operation = loads if mode == "decode" else dumps
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        operation(payload)
+    return (time.perf_counter() - start) * 1e6 / ROUNDS
+
+
+if __name__ == '__main__':
+    available = []
+    for name in codec.CODEC_PREFERENCE:
+        try:
+            available.append((name,) + codec._load_codec(name))
+        except ImportError:
+            print(f"{name} not installed, skipping")
+    print(f"selected codec: {codec.CODEC_NAME}\n")
+
+    for label, mode, payload in payloads():
+        print(label)
+        for name, loads, dumps in available:
+            print(f"  {name:<8} {run(loads, dumps, mode, payload):>12.1f} us")
@@ -0,0 +1,48 @@
+"""Wall time and bytes on the wire for getBlock with and without compressed transfer.
+
+Serves recorded blocks (bench/fixtures, see bench_transaction_details.py)
+or synthesized ones from the stub server, over a link paced to several
+simulated bandwidths, and fetches them both fully decoded and through the
+streaming parser.
+"""
+import time
+
+from bench_transaction_details import load_fixtures
+from stub_rpc import start_stub_server
+from rpc import RpcClient
+from block_stream import iter_json_array
+
+# Simulated link speeds in bytes/second
+BANDWIDTHS = [("10 Mbit/s", 10_000_000 / 8), ("100 Mbit/s", 100_000_000 / 8), ("unlimited", None)]
+FETCHES = 3
+
+
+def fetch_full(client, slot):
+    return len(client.call("getBlock", [slot])["result"]["transactions"])
+
+
+def fetch_streamed(client, slot):
+    return sum(1 for _ in iter_json_array(client.call_stream("getBlock", [slot]), "transactions"))
+
+
+if __name__ == '__main__':
+    server, url = start_stub_server()
+    server.block_bodies = load_fixtures()["full"]
+
+    print(f"{'link':<12} {'encoding':<10} {'parser':<9} {'ms/block':>10} {'wire bytes/block':>18}")
+    for label, bandwidth in BANDWIDTHS:
+        server.bandwidth = bandwidth
+        for compress in (False, True):
+            for parser, fetch in (("full", fetch_full), ("stream", fetch_streamed)):
+                client = RpcClient(url, compress=compress)
+                start = time.perf_counter()
+                for slot in range(FETCHES):
+                    fetch(client, slot)
+                elapsed_ms = (time.perf_counter() - start) * 1000 / FETCHES
+
+                encoding = "gzip" if compress else "identity"
+                print(f"{label:<12} {encoding:<10} {parser:<9} {elapsed_ms:>10.1f} "
+                      f"{client.bytes_on_wire / FETCHES:>18,.0f}")
+                client.close()
+
+    server.shutdown()
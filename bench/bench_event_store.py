@@ -0,0 +1,78 @@
+"""Memory of a buffer of rendered strings vs the EventStore, plus render cost.
+
+The last row is the steady-state cost the follower sees: re-rendering a full
+1000-event buffer after each new block of a few signatures.
+"""
+import time
+import tracemalloc
+from collections import deque
+
+from stub_rpc import fake_signature
+from events import EventStore
+from narrative import build_signature_strings
+
+EVENTS = 100000
+FOLLOW_BUFFER = 1000
+FOLLOW_BLOCKS = 50
+
+
+def measure(label, build):
+    # Signature strings are created inside build(), so whatever the buffer keeps of them is counted
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    buffer = build()
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    print(f"{label:<32} {used / EVENTS:8.1f} bytes/event")
+    return buffer
+
+
+def block_signatures(slot):
+    return [fake_signature(slot, i) for i in range(1000)]
+
+
+if __name__ == '__main__':
+    def build_strings():
+        buffer = deque(maxlen=EVENTS)
+        for slot in range(EVENTS // 1000):
+            buffer.extend(build_signature_strings(block_signatures(slot)))
+        return buffer
+
+    def build_store():
+        store = EventStore(EVENTS)
+        for slot in range(EVENTS // 1000):
+            store.extend(slot, block_signatures(slot))
+        return store
+
+    def build_rendered_store():
+        store = build_store()
+        store.render("json")
+        return store
+
+    measure("deque of rendered strings", build_strings)
+    measure("EventStore", build_store)
+    store = measure("EventStore + lines/JSON snapshots", build_rendered_store)
+    print(f"EventStore.memory_bytes()        {store.memory_bytes() / EVENTS:8.1f} bytes/event")
+
+    store = EventStore(EVENTS)
+    for slot in range(EVENTS // 1000):
+        store.extend(slot, block_signatures(slot))
+    for format in ("lines", "json", "records"):
+        start = time.perf_counter()
+        store.render(format)
+        first = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        store.render(format)
+        cached = (time.perf_counter() - start) * 1000
+        print(f"render {format:<8} first {first:8.2f} ms, cached {cached:.4f} ms")
+
+    store = EventStore(FOLLOW_BUFFER)
+    for slot in range(FOLLOW_BUFFER // 100):
+        store.extend(slot, block_signatures(slot)[:100])
+    store.render("lines")
+    start = time.perf_counter()
+    for slot in range(FOLLOW_BLOCKS):
+        store.extend(slot, [fake_signature(EVENTS + slot, i) for i in range(3)])
+        store.render("lines")
+    elapsed = (time.perf_counter() - start) * 1000 / FOLLOW_BLOCKS
+    print(f"re-render {FOLLOW_BUFFER} events after each 3-signature block: {elapsed:.2f} ms")
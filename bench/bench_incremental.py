@@ -0,0 +1,58 @@
+"""Telegram traffic under steady polling: refetching the last 10 messages vs min_id cursors.
+
+Clients poll /api/messages's get_channel_messages() at a fixed rate while
+the stub channels receive a new message every POST_INTERVAL seconds.
+Counts the Telegram calls made and the messages they returned.
+"""
+import asyncio
+import time
+
+from stub_telegram import StubTelegramClient
+import app
+from channel_buffer import ChannelBuffer
+
+CHANNELS = ["@gmgnsignals", "@PumpLiveKOTH", "@channel3"]
+DURATION = 6.0
+POST_INTERVAL = 0.5
+
+
+async def refetch_last_10():
+    # get_channel_messages() before cursors: the same last 10 messages every time
+    for channel in app.CHANNELS:
+        entity = await app.entity_cache.get(channel)
+        [app.format_message(msg) for msg in await app.client.get_messages(entity, limit=10)]
+
+
+async def poll(fetch, request_rate):
+    app.CHANNELS = CHANNELS
+    app.client = StubTelegramClient(CHANNELS, latency=0)
+    app.client.connected = True
+    app.channel_buffer = ChannelBuffer(app.CHANNEL_BUFFER_SIZE)
+    await app.entity_cache.warm(CHANNELS)
+
+    start = time.monotonic()
+    calls, returned = app.client.calls, app.client.returned
+    requests = posted = 0
+    while time.monotonic() - start < DURATION:
+        # New messages keep arriving at a steady rate regardless of request volume
+        while posted < (time.monotonic() - start) / POST_INTERVAL:
+            app.client.post(CHANNELS[posted % len(CHANNELS)])
+            posted += 1
+        await fetch()
+        requests += 1
+        await asyncio.sleep(1 / request_rate)
+    return requests, posted, app.client.calls - calls, app.client.returned - returned
+
+
+if __name__ == '__main__':
+    print(f"{DURATION:.0f}s of polling, one new message every {POST_INTERVAL}s, {len(CHANNELS)} channels\n")
+    for request_rate in (10, 50):
+        for label, fetch, interval in (("last 10 each request", refetch_last_10, None),
+                                       ("min_id, no throttle", app.get_channel_messages, 0),
+                                       (f"min_id, {app.CHANNEL_REFRESH_INTERVAL:.0f}s refresh", app.get_channel_messages,
+                                        app.CHANNEL_REFRESH_INTERVAL)):
+            if interval is not None:
+                app.CHANNEL_REFRESH_INTERVAL = interval
+            requests, posted, calls, returned = asyncio.run(poll(fetch, request_rate))
+            print(f"{request_rate:>3} req/s {label:<22} {requests:5} requests, {posted} posted: "
+                  f"{calls:5} Telegram calls, {returned:6} messages returned")
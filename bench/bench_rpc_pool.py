@@ -0,0 +1,37 @@
+"""Compare requests/sec of bare requests.post against the pooled RpcClient."""
+import time
+
+import requests
+
+from stub_rpc import start_stub_server
+from rpc import RpcClient
+
+DURATION = 3.0
+
+PAYLOAD = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "getEpochInfo",
+    "params": []
+}
+
+
+def run(label, send):
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < DURATION:
+        send()
+        count += 1
+    elapsed = time.perf_counter() - start
+    print(f"{label:<24} {count / elapsed:10.1f} req/s")
+
+
+if __name__ == '__main__':
+    server, url = start_stub_server()
+    client = RpcClient(url, pool_size=4)
+
+    run("bare requests.post", lambda: requests.post(url, json=PAYLOAD).json())
+    run("pooled RpcClient", lambda: client.call("getEpochInfo"))
+
+    client.close()
+    server.shutdown()
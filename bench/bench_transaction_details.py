@@ -0,0 +1,89 @@
+"""Bytes transferred and parse time of getBlock responses per transactionDetails level.
+
+Uses recorded responses from bench/fixtures/ when present. To record fresh
+fixtures from a real node:
+
+    python bench_transaction_details.py --record https://api.devnet.solana.com
+
+Without fixtures, blocks are synthesized with the stub server's generator.
+"""
+import json
+import os
+import sys
+import time
+
+import requests
+
+from stub_rpc import make_block, START_SLOT
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+MODES = ["full", "accounts", "signatures", "none"]
+ROUNDS = 20
+
+
+def fixture_path(slot, mode):
+    return os.path.join(FIXTURE_DIR, f"block_{slot}_{mode}.json")
+
+
+def record(url, count=3):
+    """Record getBlock responses for the most recent finalized slots at every detail level."""
+    os.makedirs(FIXTURE_DIR, exist_ok=True)
+    slot = requests.post(url, json={"jsonrpc": "2.0", "id": 1, "method": "getSlot",
+                                    "params": [{"commitment": "finalized"}]}).json()["result"]
+    recorded = 0
+    while recorded < count:
+        for mode in MODES:
+            payload = {"jsonrpc": "2.0", "id": 1, "method": "getBlock", "params": [
+                slot, {"encoding": "json", "maxSupportedTransactionVersion": 0,
+                       "transactionDetails": mode, "rewards": False}]}
+            body = requests.post(url, json=payload).content
+            if b'"error"' in body[:200]:
+                break
+            with open(fixture_path(slot, mode), "wb") as f:
+                f.write(body)
+        else:
+            recorded += 1
+            print(f"Recorded Slot {slot}")
+        slot -= 1
+
+
+def load_fixtures():
+    """Return {mode: [raw response bytes]} from disk, or synthesized blocks if there are none."""
+    fixtures = {mode: [] for mode in MODES}
+    names = sorted(os.listdir(FIXTURE_DIR)) if os.path.isdir(FIXTURE_DIR) else []
+    for name in names:
+        mode = name.rsplit("_", 1)[-1][:-len(".json")]
+        if mode in fixtures:
+            with open(os.path.join(FIXTURE_DIR, name), "rb") as f:
+                fixtures[mode].append(f.read())
+
+    if not any(fixtures.values()):
+        print("No recorded fixtures found, synthesizing 3 blocks of 1500 transactions\n")
+        for slot in range(START_SLOT, START_SLOT + 3):
+            # The stub generator does not model the "accounts" level
+            for mode in ["full", "signatures", "none"]:
+                result = make_block(slot, 1500, mode)
+                fixtures[mode].append(json.dumps({"jsonrpc": "2.0", "id": 1, "result": result}).encode())
+    return fixtures
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 3 and sys.argv[1] == "--record":
+        record(sys.argv[2])
+        sys.exit()
+
+    fixtures = load_fixtures()
+    print(f"{'mode':<12} {'bytes/block':>14} {'parse ms/block':>16}")
+    for mode in MODES:
+        bodies = fixtures[mode]
+        if not bodies:
+            continue
+        size = sum(len(body) for body in bodies) / len(bodies)
+
+        start = time.perf_counter()
+        for _ in range(ROUNDS):
+            for body in bodies:
+                json.loads(body)
+        parse_ms = (time.perf_counter() - start) * 1000 / (ROUNDS * len(bodies))
+
+        print(f"{mode:<12} {size:>14,.0f} {parse_ms:>16.3f}")
@@ -0,0 +1,119 @@
+"""Replay synthetic Telegram updates through app.py's event-driven ingest.
+
+Registers the NewMessage/edit/delete handlers on the stub client, seeds
+the ring buffer, then replays a seeded random mix of new, edited and
+deleted messages (including edits and deletes of messages that have
+already been evicted). After every update the ring buffer is checked
+against a simple reference model; at the end /api/messages is checked
+through Flask's test client and handler and serving latencies are
+reported. Exits non-zero on the first mismatch.
+"""
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+from collections import OrderedDict
+
+os.environ["TELEGRAM_INGEST_MODE"] = "events"
+os.environ.setdefault("MESSAGE_RING_SIZE", "50")
+
+from stub_telegram import StubDeletedEvent, StubMessageEvent, StubTelegramClient
+import app
+
+UPDATES = 3000
+SEED = 7
+
+
+class Model:
+    """Reference behaviour: bounded, insertion-ordered, edits in place, deletes remove."""
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.messages = OrderedDict()
+
+    def add(self, message):
+        self.messages[(message.chat_id, message.id)] = app.format_message(message)
+        while len(self.messages) > self.capacity:
+            self.messages.popitem(last=False)
+
+    def edit(self, message):
+        key = (message.chat_id, message.id)
+        if key in self.messages:
+            self.messages[key] = app.format_message(message)
+
+    def remove(self, chat_id, message_ids):
+        for message_id in message_ids:
+            self.messages.pop((chat_id, message_id), None)
+
+    def expected(self):
+        return sorted(self.messages.values(), key=lambda x: x['date'], reverse=True)
+
+
+def check(step, model):
+    if app.message_ring.messages() != model.expected():
+        print(f"Mismatch after update {step}: ring has {len(app.message_ring)} messages, "
+              f"model has {len(model.messages)}")
+        sys.exit(1)
+
+
+async def replay():
+    stub = StubTelegramClient(app.CHANNELS, messages_per_channel=20, latency=0)
+    app.client = stub
+    await app.start_event_ingest()
+
+    model = Model(app.MESSAGE_RING_SIZE)
+    for channel in app.CHANNELS:
+        for message in stub.messages[channel][-app.CHANNEL_BUFFER_SIZE:]:
+            model.add(message)
+    check("seed", model)
+
+    rng = random.Random(SEED)
+    handler_us = []
+    for step in range(UPDATES):
+        channel = rng.choice(app.CHANNELS)
+        roll = rng.random()
+        if roll < 0.7 or not stub.messages[channel]:
+            message = stub.post(channel)
+            update = StubMessageEvent(message)
+            model.add(message)
+        elif roll < 0.85:
+            # Any message still in the channel, including ones evicted from the ring
+            target = rng.choice(stub.messages[channel])
+            message = stub.edit(channel, target.id, f"{target.text} (edited {step})")
+            update = StubMessageEvent(message, edited=True)
+            model.edit(message)
+        else:
+            ids = [message.id for message in rng.sample(stub.messages[channel], min(2, len(stub.messages[channel])))]
+            stub.delete(channel, ids)
+            update = StubDeletedEvent(stub.chats[channel].id, ids)
+            model.remove(update.chat_id, ids)
+
+        start = time.perf_counter()
+        await stub.dispatch(update)
+        handler_us.append((time.perf_counter() - start) * 1e6)
+        check(step, model)
+    return handler_us
+
+
+async def read_messages(count):
+    for _ in range(count):
+        await app.get_channel_messages()
+
+
+if __name__ == '__main__':
+    handler_us = asyncio.run(replay())
+    print(f"Replayed {UPDATES} updates against a {app.MESSAGE_RING_SIZE}-message ring: OK {app.message_ring.stats()}")
+    print(f"Handler latency: p50 {statistics.median(handler_us):.1f} us, max {max(handler_us):.1f} us")
+
+    client = app.app.test_client()
+    response = client.get('/api/messages')
+    assert response.status_code == 200 and response.get_json() == app.message_ring.messages()
+    assert response.headers['X-Channels-Failed'] == ''
+    print(f"/api/messages serves the ring: {len(response.get_json())} messages, "
+          f"channels {response.headers['X-Channels-Included']}")
+
+    start = time.perf_counter()
+    asyncio.run(read_messages(10000))
+    print(f"get_channel_messages() from the ring: {(time.perf_counter() - start) / 10000 * 1e6:.2f} us")
@@ -0,0 +1,165 @@
+"""Local stand-in for a Solana JSON-RPC node, used by the benchmarks in this folder."""
+import gzip
+import hashlib
+import json
+import os
+import socket
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Make the api/ modules importable from the benchmark scripts
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "api"))
+
+import b58
+
+START_SLOT = 300000000
+
+
+def fake_signature(slot, index):
+    """Build a deterministic, valid base58 signature for a transaction in a slot."""
+    return b58.encode(hashlib.sha512(f"{slot}:{index}".encode()).digest())
+
+
+def make_transaction(slot, index):
+    """Build one transaction shaped like a typical "full" json-encoded vote/swap."""
+    keys = [fake_signature(slot + k, index)[:44] for k in range(8)]
+    return {
+        "meta": {
+            "computeUnitsConsumed": 2100,
+            "err": None,
+            "fee": 5000,
+            "innerInstructions": [],
+            "logMessages": [f"Program {keys[k % 8]} invoke [1]" for k in range(10)],
+            "postBalances": [1000000000 - index * 5000 - k for k in range(8)],
+            "postTokenBalances": [],
+            "preBalances": [1000000000 - k for k in range(8)],
+            "preTokenBalances": [],
+            "status": {"Ok": None}
+        },
+        "transaction": {
+            "message": {
+                "accountKeys": keys,
+                "header": {"numReadonlySignedAccounts": 0, "numReadonlyUnsignedAccounts": 3,
+                           "numRequiredSignatures": 1},
+                "instructions": [
+                    {"accounts": [0, 1, 2, 3], "data": fake_signature(slot, index)[:64], "programIdIndex": 7,
+                     "stackHeight": None}
+                    for _ in range(3)
+                ],
+                "recentBlockhash": keys[0]
+            },
+            "signatures": [fake_signature(slot, index)]
+        },
+        "version": 0
+    }
+
+
+def make_block(slot, tx_count=50, transaction_details="full"):
+    """Build a getBlock result shaped like the RPC node's json encoding at a detail level."""
+    block = {
+        "blockHeight": slot - 1000,
+        "blockTime": 1700000000 + slot,
+        "blockhash": fake_signature(slot, 0)[:44],
+        "parentSlot": slot - 1,
+        "previousBlockhash": fake_signature(slot - 1, 0)[:44]
+    }
+    if transaction_details == "signatures":
+        block["signatures"] = [fake_signature(slot, i) for i in range(tx_count)]
+    elif transaction_details == "full":
+        block["transactions"] = [make_transaction(slot, i) for i in range(tx_count)]
+    return block
+
+
+class StubRpcHandler(BaseHTTPRequestHandler):
+    """Answers getEpochInfo, getSlot and getBlock (single or batched) over keep-alive HTTP/1.1."""
+
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        # Headers and body go out in separate writes; without this, delayed ACKs
+        # stall every keep-alive response by ~40 ms and hide the pooling win
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def log_message(self, format, *args):
+        pass
+
+    def answer(self, request):
+        method = request.get("method")
+        params = request.get("params") or []
+        if method == "getEpochInfo":
+            result = {"absoluteSlot": self.server.latest_slot, "epoch": 700}
+        elif method == "getSlot":
+            result = self.server.latest_slot
+        elif method == "getBlock" and params[0] in self.server.skipped_slots:
+            return {"jsonrpc": "2.0", "id": request.get("id"),
+                    "error": {"code": -32007, "message": f"Slot {params[0]} was skipped"}}
+        elif method == "getBlock":
+            config = params[1] if len(params) > 1 else {}
+            result = make_block(params[0], self.server.tx_count, config.get("transactionDetails", "full"))
+        else:
+            return {"jsonrpc": "2.0", "id": request.get("id"),
+                    "error": {"code": -32601, "message": "Method not found"}}
+        return {"jsonrpc": "2.0", "id": request.get("id"), "result": result}
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        request = json.loads(self.rfile.read(length))
+
+        # Simulated node latency
+        if self.server.delay:
+            time.sleep(self.server.delay)
+
+        # JSON-RPC batches arrive as an array and are answered with an array
+        if isinstance(request, list):
+            body = json.dumps([self.answer(item) for item in request]).encode()
+        elif request.get("method") == "getBlock" and self.server.block_bodies:
+            # Replay recorded getBlock responses verbatim
+            bodies = self.server.block_bodies
+            body = bodies[request["params"][0] % len(bodies)]
+        else:
+            body = json.dumps(self.answer(request)).encode()
+
+        compressed = self.server.compress and "gzip" in self.headers.get("Accept-Encoding", "")
+        if compressed:
+            body = gzip.compress(body, compresslevel=5)
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        if compressed:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.write_body(body)
+
+    def write_body(self, body):
+        """Write the body, paced to the simulated link bandwidth if one is set."""
+        bandwidth = self.server.bandwidth
+        if not bandwidth:
+            self.wfile.write(body)
+            return
+
+        chunk_size = 16384
+        start = time.perf_counter()
+        for offset in range(0, len(body), chunk_size):
+            self.wfile.write(body[offset:offset + chunk_size])
+            ahead = (offset + chunk_size) / bandwidth - (time.perf_counter() - start)
+            if ahead > 0:
+                time.sleep(ahead)
+
+
+def start_stub_server(tx_count=50, handler=StubRpcHandler):
+    """Start the stub server on a free local port and return (server, url)."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    server.latest_slot = START_SLOT
+    server.tx_count = tx_count
+    server.skipped_slots = set()
+    server.delay = 0
+    server.compress = True
+    server.bandwidth = None  # bytes/second, None for unlimited
+    server.block_bodies = []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
@@ -0,0 +1,161 @@
+"""In-process stand-in for the Telethon client used by app.py.
+
+Channels hold synthetic messages with increasing ids; every API call
+sleeps for `latency` seconds to mimic a round trip to Telegram and records
+the event loop it ran on. Registered event handlers can be fed synthetic
+new/edit/delete updates with dispatch().
+"""
+import asyncio
+import copy
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+from telethon import events
+from telethon.tl.types import InputPeerChannel
+
+# Import app.py from the repository root, keeping its Telegram session and entity cache in memory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("TELEGRAM_SESSION", "")
+os.environ.setdefault("ENTITY_CACHE_PATH", "")
+
+START_DATE = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+class StubChat:
+    def __init__(self, username, channel_id):
+        self.id = channel_id
+        self.username = username.lstrip("@")
+        self.title = self.username
+
+
+class StubMessage:
+    def __init__(self, message_id, chat, text):
+        self.id = message_id
+        self.chat = chat
+        self.chat_id = chat.id
+        self.date = START_DATE + timedelta(seconds=message_id)
+        self.text = text
+        self.media = None
+        self.views = message_id * 3
+        self.forwards = message_id % 7
+        self._resolved_chat = chat
+
+    async def get_chat(self):
+        """Like Telethon's Message.get_chat(): loads the chat onto the message."""
+        self.chat = self._resolved_chat
+        return self.chat
+
+
+class StubMessageEvent:
+    """A NewMessage (or, with edited=True, MessageEdited) update carrying one message.
+
+    Like a real update that arrives without the channel entity, the message's
+    chat is unset until message.get_chat() loads it; event.get_chat() only
+    caches the chat on the event, as Telethon does.
+    """
+
+    def __init__(self, message, edited=False):
+        self.kind = events.MessageEdited if edited else events.NewMessage
+        self.message = copy.copy(message)
+        self.message.chat = None
+        self.chat_id = message.chat_id
+        self._chat = None
+
+    async def get_chat(self):
+        self._chat = self.message._resolved_chat
+        return self._chat
+
+
+class StubDeletedEvent:
+    """A MessageDeleted update."""
+
+    kind = events.MessageDeleted
+
+    def __init__(self, chat_id, deleted_ids):
+        self.chat_id = chat_id
+        self.deleted_ids = deleted_ids
+
+
+class StubTelegramClient:
+    """Serves get_entity/get_messages from in-memory channels."""
+
+    def __init__(self, channels, messages_per_channel=50, latency=0.02, channel_latency=None):
+        self.latency = latency
+        # Per-channel overrides of latency, e.g. one channel that hangs
+        self.channel_latency = channel_latency or {}
+        self.connected = False
+        self.calls = 0
+        # Messages handed back by get_messages, i.e. what would cross the wire
+        self.returned = 0
+        self.loops = set()
+        self.chats = {channel: StubChat(channel, n + 1) for n, channel in enumerate(channels)}
+        self.messages = {channel: [] for channel in channels}
+        self.next_id = 1
+        # (callback, event builder) pairs from add_event_handler()
+        self.handlers = []
+        for channel in channels:
+            for _ in range(messages_per_channel):
+                self.post(channel)
+
+    def post(self, channel, text=None):
+        """Append a message to a channel and return it."""
+        message = StubMessage(self.next_id, self.chats[channel], text or f"Signal {self.next_id} in {channel}")
+        self.messages[channel].append(message)
+        self.next_id += 1
+        return message
+
+    def edit(self, channel, message_id, text):
+        """Change a message's text and return it, or None if there is no such message."""
+        for message in self.messages[channel]:
+            if message.id == message_id:
+                message.text = text
+                return message
+        return None
+
+    def delete(self, channel, message_ids):
+        self.messages[channel] = [message for message in self.messages[channel] if message.id not in message_ids]
+
+    def add_event_handler(self, callback, event):
+        self.handlers.append((callback, event))
+
+    async def dispatch(self, update):
+        """Run the handlers registered for a synthetic update's event type."""
+        for callback, builder in self.handlers:
+            # Exact type: MessageEdited is a subclass of NewMessage
+            if type(builder) is update.kind:
+                await callback(update)
+
+    def is_connected(self):
+        return self.connected
+
+    async def connect(self):
+        await self._round_trip()
+        self.connected = True
+
+    async def disconnect(self):
+        self.connected = False
+
+    async def get_entity(self, channel):
+        await self._round_trip(channel)
+        if channel not in self.chats:
+            raise ValueError(f"No user has \"{channel}\" as username")
+        return self.chats[channel]
+
+    async def get_input_entity(self, channel):
+        chat = await self.get_entity(channel)
+        return InputPeerChannel(chat.id, chat.id * 7919)
+
+    async def get_messages(self, entity, limit=10, min_id=0):
+        # Accepts a chat from get_entity() or a peer from get_input_entity()
+        chat_id = entity.channel_id if isinstance(entity, InputPeerChannel) else entity.id
+        channel = next(name for name, chat in self.chats.items() if chat.id == chat_id)
+        await self._round_trip(channel)
+        newest_first = [message for message in reversed(self.messages[channel]) if message.id > min_id][:limit]
+        self.returned += len(newest_first)
+        return newest_first
+
+    async def _round_trip(self, channel=None):
+        self.calls += 1
+        self.loops.add(id(asyncio.get_running_loop()))
+        await asyncio.sleep(self.channel_latency.get(channel, self.latency))
@@ -0,0 +1,98 @@
+"""Local stand-in for the Solana WebSocket API that emits slotNotification messages.
+
+Run directly to exercise SlotSubscriber against it, including a forced
+disconnect to check that it reconnects and resubscribes.
+"""
+import asyncio
+import json
+import threading
+import time
+
+import websockets
+
+from stub_rpc import START_SLOT
+
+
+class StubSlotServer:
+    """Accepts slotSubscribe and pushes a new slot every `interval` seconds."""
+
+    def __init__(self, interval=0.05, root_lag=32):
+        self.interval = interval
+        self.root_lag = root_lag
+        self.slot = START_SLOT
+        self.subscriptions = 0
+        self.url = None
+        self._connections = set()
+        self._loop = None
+
+    async def handler(self, ws, *args):
+        self._connections.add(ws)
+        try:
+            request = json.loads(await ws.recv())
+            if request.get("method") != "slotSubscribe":
+                await ws.send(json.dumps({"jsonrpc": "2.0", "id": request.get("id"),
+                                          "error": {"code": -32601, "message": "Method not found"}}))
+                return
+
+            self.subscriptions += 1
+            subscription = self.subscriptions
+            await ws.send(json.dumps({"jsonrpc": "2.0", "id": request.get("id"), "result": subscription}))
+
+            while True:
+                await asyncio.sleep(self.interval)
+                await ws.send(json.dumps({
+                    "jsonrpc": "2.0",
+                    "method": "slotNotification",
+                    "params": {
+                        "result": {"parent": self.slot - 1, "root": self.slot - self.root_lag, "slot": self.slot},
+                        "subscription": subscription
+                    }
+                }))
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            self._connections.discard(ws)
+
+    async def _tick(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            self.slot += 1
+
+    def drop_connections(self):
+        """Close every client connection, as a flaky RPC node would."""
+        for ws in list(self._connections):
+            asyncio.run_coroutine_threadsafe(ws.close(), self._loop)
+
+    def start(self):
+        """Serve on a free local port in a background thread; returns the ws:// URL."""
+        ready = threading.Event()
+
+        async def main():
+            self._loop = asyncio.get_running_loop()
+            async with websockets.serve(self.handler, "127.0.0.1", 0) as server:
+                port = list(server.sockets)[0].getsockname()[1]
+                self.url = f"ws://127.0.0.1:{port}"
+                ready.set()
+                await self._tick()
+
+        threading.Thread(target=asyncio.run, args=(main(),), daemon=True).start()
+        ready.wait()
+        return self.url
+
+
+if __name__ == '__main__':
+    from ws_ingest import SlotSubscriber
+
+    server = StubSlotServer()
+    url = server.start()
+
+    subscriber = SlotSubscriber(url, reconnect_delay=0.1)
+    subscriber.start()
+    time.sleep(1)
+    print("before disconnect:", subscriber.stats())
+
+    server.drop_connections()
+    time.sleep(1)
+    print("after disconnect: ", subscriber.stats())
+    print("server saw", server.subscriptions, "subscriptions")
+    subscriber.stop(1)
@@ -0,0 +1,132 @@
+import threading
+from collections import OrderedDict
+
+
+class ChannelBuffer:
+    """The newest formatted messages of each channel, merged in incrementally.
+
+    The highest message id seen per channel is its cursor: the next fetch
+    only asks Telegram for messages above it (min_id) and merges them in,
+    keeping at most `size` messages per channel.
+    """
+
+    def __init__(self, size=10):
+        self.size = size
+        # channel -> {message id: formatted message}
+        self._messages = {}
+        self._cursors = {}
+        # channel -> time.monotonic() of the last successful fetch
+        self.refreshed = {}
+        self._lock = threading.Lock()
+
+        self.merged = 0
+
+    def cursor(self, channel):
+        """Highest message id seen in a channel, 0 before the first fetch."""
+        return self._cursors.get(channel, 0)
+
+    def merge(self, channel, messages, refreshed=None):
+        """Add formatted messages to a channel, dropping the oldest beyond `size`."""
+        with self._lock:
+            buffered = self._messages.setdefault(channel, {})
+            for message in messages:
+                buffered[message['id']] = message
+            for message_id in sorted(buffered)[:-self.size]:
+                del buffered[message_id]
+            if buffered:
+                self._cursors[channel] = max(self._cursors.get(channel, 0), max(buffered))
+            if refreshed is not None:
+                self.refreshed[channel] = refreshed
+            self.merged += len(messages)
+
+    def messages(self, channel):
+        """A channel's buffered messages, newest first."""
+        with self._lock:
+            buffered = self._messages.get(channel, {})
+            return [buffered[message_id] for message_id in sorted(buffered, reverse=True)]
+
+    def stats(self):
+        with self._lock:
+            return {
+                "channels": len(self._messages),
+                "buffered": sum(len(buffered) for buffered in self._messages.values()),
+                "merged": self.merged,
+                "cursors": dict(self._cursors)
+            }
+
+
+class MessageRing:
+    """Bounded buffer of formatted messages pushed by Telegram update handlers.
+
+    Messages are keyed by (chat id, message id). New ones are appended and
+    the oldest are evicted beyond `capacity`; edits replace a buffered
+    message in place and deletions remove it. The newest-first snapshot is
+    built once per change.
+    """
+
+    def __init__(self, capacity=500):
+        self.capacity = capacity
+        self._messages = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped on every change, so readers can cache whatever they derive from a snapshot
+        self.version = 0
+        self._snapshot = (0, [])
+
+        self.added = 0
+        self.edited = 0
+        self.deleted = 0
+        self.evicted = 0
+
+    def __len__(self):
+        return len(self._messages)
+
+    def add(self, chat_id, message):
+        """Append a new message, or replace it if it is already buffered."""
+        with self._lock:
+            self._messages[(chat_id, message['id'])] = message
+            while len(self._messages) > self.capacity:
+                self._messages.popitem(last=False)
+                self.evicted += 1
+            self.added += 1
+            self.version += 1
+
+    def edit(self, chat_id, message):
+        """Replace a buffered message; edits to messages no longer buffered are ignored."""
+        with self._lock:
+            key = (chat_id, message['id'])
+            if key not in self._messages:
+                return False
+            self._messages[key] = message
+            self.edited += 1
+            self.version += 1
+            return True
+
+    def remove(self, chat_id, message_ids):
+        """Drop deleted messages; a chat_id of None matches the ids in any chat."""
+        with self._lock:
+            message_ids = set(message_ids)
+            keys = [key for key in self._messages
+                    if key[1] in message_ids and (chat_id is None or key[0] == chat_id)]
+            for key in keys:
+                del self._messages[key]
+            if keys:
+                self.deleted += len(keys)
+                self.version += 1
+
+    def messages(self):
+        """Buffered messages, newest first."""
+        with self._lock:
+            if self._snapshot[0] != self.version:
+                snapshot = sorted(self._messages.values(), key=lambda x: x['date'], reverse=True)
+                self._snapshot = (self.version, snapshot)
+            return self._snapshot[1]
+
+    def stats(self):
+        return {
+            "buffered": len(self._messages),
+            "capacity": self.capacity,
+            "added": self.added,
+            "edited": self.edited,
+            "deleted": self.deleted,
+            "evicted": self.evicted
+        }
@@ -0,0 +1,91 @@
+import asyncio
+import json
+import os
+import time
+
+from telethon.tl import types
+
+
+class EntityCache:
+    """Resolved Telegram input peers, kept in memory and in a JSON file.
+
+    Usernames and ids almost never change their peer, so a resolved entry
+    is reused for `ttl` seconds (and across restarts) instead of costing a
+    round trip per request. Callers invalidate an entry when a call made
+    with it fails, so a stale access hash gets resolved again.
+    """
+
+    def __init__(self, resolve, path=None, ttl=7 * 24 * 3600):
+        # resolve(key) -> awaitable input peer, e.g. client.get_input_entity
+        self.resolve = resolve
+        self.path = path
+        self.ttl = ttl
+        # key -> (input peer, resolved at as a unix time)
+        self._entries = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._load()
+
+    async def get(self, key):
+        """Return the cached input peer for a channel, resolving it on a miss."""
+        entry = self._entries.get(key)
+        if entry is not None and time.time() - entry[1] < self.ttl:
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        peer = await self.resolve(key)
+        self._entries[key] = (peer, time.time())
+        self._save()
+        return peer
+
+    def invalidate(self, key):
+        if self._entries.pop(key, None) is not None:
+            self.invalidations += 1
+            self._save()
+
+    async def warm(self, keys):
+        """Resolve all keys concurrently; returns the ones that failed."""
+        results = await asyncio.gather(*(self.get(key) for key in keys), return_exceptions=True)
+        failed = []
+        for key, result in zip(keys, results):
+            if isinstance(result, Exception):
+                print(f"Error resolving {key}: {str(result)}")
+                failed.append(key)
+        return failed
+
+    def stats(self):
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations
+        }
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path) as f:
+                stored = json.load(f)
+            for key, entry in stored.items():
+                peer = dict(entry["peer"])
+                self._entries[key] = (getattr(types, peer.pop("_"))(**peer), entry["resolved"])
+        except (OSError, ValueError, KeyError, AttributeError, TypeError) as e:
+            print(f"Ignoring unreadable entity cache {self.path}: {str(e)}")
+            self._entries = {}
+
+    def _save(self):
+        if not self.path:
+            return
+        stored = {key: {"peer": peer.to_dict(), "resolved": resolved} for key, (peer, resolved) in self._entries.items()}
+        # Write to a temporary file and swap it in so a crash never leaves a torn cache
+        temporary = f"{self.path}.tmp"
+        try:
+            with open(temporary, "w") as f:
+                json.dump(stored, f)
+            os.replace(temporary, self.path)
+        except OSError as e:
+            print(f"Error writing entity cache {self.path}: {str(e)}")
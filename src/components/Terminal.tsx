@@ -1,12 +1,17 @@
 import React, { useEffect, useRef, useState } from 'react';
 import { format } from 'date-fns';
 
+const maxPoolSize = 1000;
+const maxPendingLines = 20;
+
 const Terminal = () => {
   const terminalRef = useRef<HTMLDivElement>(null);
   const [displayedCode, setDisplayedCode] = useState<string[]>([]);
   const [currentTime, setCurrentTime] = useState(new Date());
   const status = 'ACTIVE';
-  const [functions, setFunctions] = useState<string[]>([]);
+  // Kept in refs so streamed lines don't restart the typing interval
+  const functionsRef = useRef<string[]>([]);
+  const pendingRef = useRef<string[]>([]);
 
   const statusColors = {
     ACTIVE: 'bg-green-500',
@@ -15,23 +20,48 @@ const Terminal = () => {
     ANALYZING: 'bg-purple-500'
   };
 
-  // Fetch functions from backend
+  // Fetch functions from backend; returns the event id to stream from, or null when the
+  // server has no live stream to offer
   const fetchFunctions = async () => {
     try {
       const response = await fetch('/api/messages');
       const data = await response.json();
-      setFunctions(data); // Update state with fetched functions
+      functionsRef.current = [...data, ...functionsRef.current]; // Keep any lines already streamed
+      if (response.headers.get('X-Live-Stream') !== '1') return null;
+      return response.headers.get('X-Last-Event-ID') ?? '0';
     } catch (error) {
       console.error('Error fetching functions:', error);
+      return null;
     }
   };
 
   useEffect(() => {
-    fetchFunctions(); // Fetch functions on component mount
+    let source: EventSource | null = null;
+    let closed = false;
+
+    // Fetch functions on component mount. Live lines arrive over Server-Sent Events, but only
+    // when a follower is running. The stream starts right after the snapshot's last event, so
+    // nothing produced in between is lost; EventSource resumes with Last-Event-ID on reconnect
+    fetchFunctions().then((lastEventId) => {
+      if (lastEventId === null || closed) return;
+      source = new EventSource(`/api/stream?last_event_id=${encodeURIComponent(lastEventId)}`);
+      source.onmessage = (event) => {
+        const line = JSON.parse(event.data);
+        functionsRef.current = [...functionsRef.current, line].slice(-maxPoolSize);
+        pendingRef.current = [...pendingRef.current, line].slice(-maxPendingLines);
+      };
+    });
+    return () => {
+      closed = true;
+      source?.close();
+    };
   }, []);
 
-  // Function to generate random code
+  // Type streamed lines first, then random ones from the pool
   const generateCode = () => {
+    const next = pendingRef.current.shift();
+    if (next) return next;
+    const functions = functionsRef.current;
     if (functions.length === 0) return ''; // Return empty string if no functions
     return functions[Math.floor(Math.random() * functions.length)];
   };
@@ -83,7 +113,7 @@ const Terminal = () => {
     }, 1500);
   
     return () => clearInterval(typingInterval);
-  }, [functions]);
+  }, []);
   return (
     <div className="relative space-y-2 sm:space-y-4 mb-8">
       <div className="terminal-header p-2 sm:p-4 border border-white/5 rounded-lg flex items-center justify-between">